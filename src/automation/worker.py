@@ -1,4 +1,4 @@
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, QMetaObject, Qt, pyqtSignal, pyqtSlot
 import logging
 import gc
 import psutil
@@ -7,6 +7,7 @@ import traceback
 import json
 import os
 import random
+import itertools
 import requests
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
@@ -31,6 +32,11 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 logger = logging.getLogger(__name__)
 
+# Task queue priorities (lower runs first)
+PRIORITY_FORCED = 0  # User-initiated "Run Now" requests
+PRIORITY_SCHEDULED = 2  # Regular scheduled tasks
+PRIORITY_BACKGROUND = 3  # Statistics and other background work
+
 
 class TaskConfig:
     """Configuration for automated tasks"""
@@ -44,6 +50,7 @@ class TaskConfig:
         schedule: Dict[str, bool] = None,
         retry_count: int = 3,
         timeout: int = 300,
+        priority: int = PRIORITY_SCHEDULED,
     ):
         self.name = name
         self.description = description
@@ -60,6 +67,7 @@ class TaskConfig:
         }
         self.retry_count = retry_count
         self.timeout = timeout
+        self.priority = priority
         self.enabled = True
         self.last_run = None
         self.next_run = None
@@ -76,6 +84,7 @@ class TaskConfig:
             "schedule": self.schedule,
             "retry_count": self.retry_count,
             "timeout": self.timeout,
+            "priority": self.priority,
             "enabled": self.enabled,
             "last_run": self.last_run.isoformat() if self.last_run else None,
             "next_run": self.next_run.isoformat() if self.next_run else None,
@@ -95,6 +104,7 @@ class TaskConfig:
             schedule=data.get("schedule", {}),
             retry_count=data.get("retry_count", 3),
             timeout=data.get("timeout", 300),
+            priority=data.get("priority", PRIORITY_SCHEDULED),
         )
         task.enabled = data.get("enabled", True)
         task.last_run = (
@@ -109,8 +119,8 @@ class TaskConfig:
         return task
 
 
-class AutomationWorker(QThread):
-    """Enhanced worker thread for handling automated tasks"""
+class AutomationWorker(QObject):
+    """Worker for handling automated tasks, run on a QThread via moveToThread"""
 
     # Signals
     status_changed = pyqtSignal(
@@ -123,6 +133,8 @@ class AutomationWorker(QThread):
     )  # Task name, progress percentage, status message
     error_occurred = pyqtSignal(str)  # Error messages
     queue_updated = pyqtSignal(list)  # List of queued tasks
+    stats_updated = pyqtSignal(dict)  # Task name -> task statistics
+    finished = pyqtSignal()  # Emitted once the worker has shut down
 
     def __init__(self, db_manager):
         super().__init__()
@@ -134,10 +146,12 @@ class AutomationWorker(QThread):
         self.last_cleanup = time.time()
         self.cleanup_interval = 300  # 5 minutes
         self.task_queue = PriorityQueue()
+        self._queue_counter = itertools.count()  # FIFO order within a priority
         self.task_configs = {}
         self.running_tasks = set()  # Track currently running tasks
         self.task_history = {}
         self.config_file = "task_configs.json"
+        self._tick_timer = None
         self.selenium_driver = None
         self.config = self._load_config()
         self.wordpress_integrations = {}
@@ -220,6 +234,7 @@ class AutomationWorker(QThread):
                 description="Collect performance statistics",
                 function=self.collect_stats,
                 schedule={"friday": True},
+                priority=PRIORITY_BACKGROUND,
             ),
         }
 
@@ -248,45 +263,76 @@ class AutomationWorker(QThread):
         except Exception as e:
             logger.error(f"Error saving task configurations: {e}")
 
+    @pyqtSlot()
     def run(self):
-        """Main worker loop"""
+        """Start the worker loop; invoked on the worker thread when it starts"""
         self.running = True
         self.status_changed.emit("Running", True, False)
 
+        # Created here so the timer belongs to the worker thread
+        if self._tick_timer is None:
+            self._tick_timer = QTimer(self)
+            self._tick_timer.timeout.connect(self._tick)
+        self._tick_timer.start(1000)  # Check every second
+
+    @pyqtSlot()
+    def _tick(self):
+        """Process queued and scheduled tasks"""
         try:
-            while self.running:
-                if not self.paused:
-                    self._process_task_queue()
-                    self._schedule_pending_tasks()
-                time.sleep(1)  # Check every second
+            if self.running and not self.paused:
+                self._process_task_queue()
+                self._schedule_pending_tasks()
 
         except Exception as e:
             logger.error(f"Worker error: {e}")
             logger.error(traceback.format_exc())
             self.error_occurred.emit(f"Worker error: {str(e)}")
+            self.stop()
 
-        finally:
-            self._save_task_configs()
-            self.running = False
-            self.status_changed.emit("Stopped", False, False)
+    @pyqtSlot()
+    def _shutdown(self):
+        """Release resources and signal that the worker has finished"""
+        if self._tick_timer is None or not self._tick_timer.isActive():
+            return
+
+        self._tick_timer.stop()
+        self._save_task_configs()
+        self.cleanup_resources()
+        self.running = False
+        self.status_changed.emit("Stopped", False, False)
+        self.finished.emit()
+
+    def queue_task(self, task_name: str, priority: int = PRIORITY_FORCED):
+        """Queue a task for execution; lower priority values run first"""
+        if task_name not in self.task_configs:
+            logger.warning(f"Unknown task: {task_name}")
+            return
+        self.task_queue.put((priority, next(self._queue_counter), task_name))
 
     def _process_task_queue(self):
-        """Process queued tasks"""
-        while not self.task_queue.empty():
-            priority, task_name = self.task_queue.get()
+        """Process queued tasks, highest priority first"""
+        deferred = []
+        while self.running and not self.task_queue.empty():
+            # Pop one item per task so items queued meanwhile are honoured
+            item = self.task_queue.get()
+            task_name = item[2]
             task = self.task_configs.get(task_name)
 
             if not task or not task.enabled or task_name in self.running_tasks:
                 continue
 
             if not self._can_run_task(task):
-                self.task_queue.put((priority, task_name))
+                deferred.append(item)
                 continue
 
             self.running_tasks.add(task_name)
             self._execute_task(task)
             self.running_tasks.remove(task_name)
 
+        # Requeue tasks still waiting on dependencies for the next pass
+        for item in deferred:
+            self.task_queue.put(item)
+
     def _can_run_task(self, task: TaskConfig) -> bool:
         """Check if a task can be run based on dependencies"""
         for dep in task.dependencies:
@@ -326,6 +372,7 @@ class AutomationWorker(QThread):
         task.last_run = datetime.now()
         self._save_task_history(task, start_time)
         self.task_completed.emit(task.name, success, message)
+        self.stats_updated.emit(self.get_all_task_stats())
 
     def _schedule_pending_tasks(self):
         """Schedule tasks based on their configuration"""
@@ -338,7 +385,7 @@ class AutomationWorker(QThread):
 
             if task.schedule.get(day_name, False):
                 if not task.last_run or (now - task.last_run).days >= 1:
-                    self.task_queue.put((1, task_name))
+                    self.queue_task(task_name, task.priority)
 
     def _save_task_history(self, task: TaskConfig, start_time: float):
         """Save task execution history"""
@@ -387,14 +434,18 @@ class AutomationWorker(QThread):
             "history": history,
         }
 
+    def get_all_task_stats(self) -> Dict[str, dict]:
+        """Get statistics for every configured task"""
+        return {name: self.get_task_stats(name) for name in self.task_configs}
+
     def get_queue_status(self) -> list:
         """Get current queue status"""
-        queue_items = []
-        while not self.task_queue.empty():
-            priority, task_name = self.task_queue.get()
-            queue_items.append({"task": task_name, "priority": priority})
-            self.task_queue.put((priority, task_name))
-        return queue_items
+        with self.task_queue.mutex:
+            items = sorted(self.task_queue.queue)
+        return [
+            {"task": task_name, "priority": priority}
+            for priority, _, task_name in items
+        ]
 
     def set_task_schedule(self, task_name: str, schedule: Dict[str, bool]):
         """Set schedule for a task"""
@@ -711,10 +762,9 @@ class AutomationWorker(QThread):
         }
 
     def stop(self):
-        """Stop the worker"""
+        """Request the worker to stop; safe to call from any thread"""
         self.running = False
-        self.cleanup_resources()
-        self.wait()
+        QMetaObject.invokeMethod(self, "_shutdown", Qt.QueuedConnection)
 
     def pause(self):
         """Pause the worker"""
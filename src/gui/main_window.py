@@ -3,6 +3,7 @@ import os
 import json
 import logging
 import traceback
+import enum
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QApplication,
@@ -23,8 +24,18 @@ from PyQt5.QtWidgets import (
     QMenu,
     QComboBox,
     QSplashScreen,
+    QProgressDialog,
+)
+from PyQt5.QtCore import (
+    Qt,
+    QTimer,
+    QThread,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+    QUrl,
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QUrl
 from PyQt5.QtGui import QIcon, QPixmap, QFont, QPalette, QColor
 from urllib.parse import urlparse
 import gc
@@ -39,24 +50,12 @@ from src.utils.database import (
     DatabaseManager as DBManager,
     db_manager,
     Base,
+    backup_sqlite_database,
 )
 from src.utils.config import get_config
-from src.automation.worker import AutomationWorker
-from src.automation.integrations import WordPressIntegration
-from src.utils.api_server import ApiServer
+from src.utils.file_utils import fast_copy
 from src.gui.welcome_screen import WelcomeScreen
 
-from src.gui.tabs.wordpress_tab import WordPressTab
-from src.gui.tabs.pinterest_tab import PinterestTab
-from src.gui.tabs.settings_tab import SettingsTab
-from src.gui.tabs.reports_tab import ReportsTab
-from src.gui.tabs.dashboard_tab import DashboardTab
-from src.gui.tabs.automation_tab import AutomationTab
-from src.gui.tabs.content_tab import ContentTab
-from src.gui.tabs.log_tab import LogTab
-from src.gui.tabs.trends_tab import TrendsTab
-from src.gui.tabs.templates_tab import TemplatesTab
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -66,6 +65,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class WorkerState(enum.IntEnum):
+    """Worker state as last reported through status_changed"""
+
+    STOPPED = 1
+    RUNNING = 2
+    PAUSED = 3
+
+
 class ReportViewer(QWidget):
     """Report viewer widget for generating and displaying various reports"""
 
@@ -414,6 +421,61 @@ class MemoryManager:
             logger.error(f"Error during memory cleanup: {e}")
 
 
+class FileCopyThread(QThread):
+    """Copies a file in the background so the UI stays responsive"""
+
+    copy_finished = pyqtSignal(bool, str)  # success, error message
+
+    def __init__(self, src: str, dst: str, parent=None, copy_func=fast_copy):
+        super().__init__(parent)
+        self.src = src
+        self.dst = dst
+        self.copy_func = copy_func
+
+    def run(self):
+        try:
+            self.copy_func(self.src, self.dst)
+            self.copy_finished.emit(True, "")
+        except Exception as e:
+            logger.error(f"Error copying {self.src} to {self.dst}: {e}")
+            self.copy_finished.emit(False, str(e))
+
+
+class VacuumSignals(QObject):
+    """Signal bridge for VacuumTask (QRunnable cannot emit signals itself)"""
+
+    progress = pyqtSignal(int)  # Percentage complete
+    finished = pyqtSignal(bool, str)  # success, error message
+
+
+class VacuumTask(QRunnable):
+    """Runs VACUUM and PRAGMA optimize on a thread pool thread"""
+
+    def __init__(self, db_path: str):
+        super().__init__()
+        self.db_path = db_path
+        self.signals = VacuumSignals()
+
+    def run(self):
+        conn = None
+        try:
+            # sqlite3 connections are thread-bound, so open a dedicated one here;
+            # SQLite serializes VACUUM against the application's own connections
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            self.signals.progress.emit(10)
+            conn.execute("VACUUM")
+            self.signals.progress.emit(80)
+            conn.execute("PRAGMA optimize")
+            self.signals.progress.emit(100)
+            self.signals.finished.emit(True, "")
+        except Exception as e:
+            logger.error(f"Error optimizing database: {e}")
+            self.signals.finished.emit(False, str(e))
+        finally:
+            if conn:
+                conn.close()
+
+
 class LicenseManager:
     def __init__(self):
         self.license_key = get_config().get("LICENSE_KEY", "")
@@ -445,8 +507,13 @@ class MainWindow(QMainWindow):
 
         # Initialize state variables
         self.worker = None
+        self.worker_thread = None
+        self._worker_state = WorkerState.STOPPED
         self.api_server = None
         self.db = None
+        self.copy_thread = None
+        self._pending_restore = None  # Backup to restore once the worker stops
+        self._close_pending = False  # Close again once the worker stops
         self.memory_manager = MemoryManager()
 
         # Load system tray icon if available
@@ -544,6 +611,16 @@ class MainWindow(QMainWindow):
     def init_ui(self):
         """Initialize the UI with improved layout and error handling"""
         try:
+            from src.gui.tabs import (
+                DashboardTab,
+                WordPressTab,
+                SettingsTab,
+                AutomationTab,
+                ContentTab,
+                ReportsTab,
+                LogTab,
+            )
+
             # Central widget with tabs
             self.tabs = QTabWidget()
 
@@ -588,11 +665,26 @@ class MainWindow(QMainWindow):
             self.progress_bar.setValue(0)
             self.status_bar.addPermanentWidget(self.progress_bar)
 
+            # Coalesce bursts of progress signals into one repaint per frame
+            self._last_progress = None
+            self._progress_timer = QTimer(self)
+            self._progress_timer.setSingleShot(True)
+            self._progress_timer.setInterval(16)
+            self._progress_timer.timeout.connect(self._apply_progress)
+
             # Worker status indicator
             self.worker_status = QLabel("Worker: Not Running")
-            self.worker_status.setStyleSheet("color: gray;")
             self.status_bar.addPermanentWidget(self.worker_status)
 
+            # Prebuilt palettes so status changes avoid stylesheet parsing
+            self._status_palettes = {}
+            for color in ("gray", "orange", "green", "red"):
+                palette = QPalette(self.worker_status.palette())
+                palette.setColor(QPalette.WindowText, QColor(color))
+                self._status_palettes[color] = palette
+            self._last_status_color = "gray"
+            self.worker_status.setPalette(self._status_palettes["gray"])
+
             # Create menu
             self.create_menu()
 
@@ -795,7 +887,16 @@ class MainWindow(QMainWindow):
         self.status_label.setText(message)
 
     def update_progress(self, current, total):
-        """Update progress bar"""
+        """Record the latest progress; the bar is updated on the next frame"""
+        self._last_progress = (current, total)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _apply_progress(self):
+        """Update progress bar with the most recent progress value"""
+        if self._last_progress is None:
+            return
+        current, total = self._last_progress
         if total > 0:
             percent = int((current / total) * 100)
             self.progress_bar.setValue(percent)
@@ -804,16 +905,24 @@ class MainWindow(QMainWindow):
 
     def update_worker_status(self, message, running=False, paused=False):
         """Update worker status indicator"""
+        if not running:
+            self._worker_state = WorkerState.STOPPED
+        elif paused:
+            self._worker_state = WorkerState.PAUSED
+        else:
+            self._worker_state = WorkerState.RUNNING
+
         self.worker_status.setText(f"Worker: {message}")
 
-        # Set color based on state
+        # Set color based on state; nothing below changes if the state did not
         if running:
-            if paused:
-                self.worker_status.setStyleSheet("color: orange;")
-            else:
-                self.worker_status.setStyleSheet("color: green;")
+            color = "orange" if paused else "green"
         else:
-            self.worker_status.setStyleSheet("color: red;")
+            color = "red"
+        if color == self._last_status_color:
+            return
+        self._last_status_color = color
+        self.worker_status.setPalette(self._status_palettes[color])
 
         # Update dashboard indicator if available
         if hasattr(self, "dashboard_tab"):
@@ -832,19 +941,35 @@ class MainWindow(QMainWindow):
             if not self.worker:
                 from src.automation.worker import AutomationWorker
 
+                self.worker_thread = QThread(self)
                 self.worker = AutomationWorker(self.db)
+                self.worker.moveToThread(self.worker_thread)
+                self.worker_thread.started.connect(self.worker.run)
+                # QThread.quit is thread-safe; calling it directly from the
+                # worker thread lets closeEvent's wait() return without
+                # needing the GUI event loop it is blocking
+                self.worker.finished.connect(
+                    self.worker_thread.quit, Qt.DirectConnection
+                )
+                self.worker_thread.finished.connect(self._on_worker_stopped)
 
                 # Connect worker signals
                 self.worker.status_changed.connect(self.update_worker_status)
-                self.worker.progress_updated.connect(self.update_progress)
+                self.worker.progress_updated.connect(
+                    self.update_progress, Qt.QueuedConnection
+                )
 
                 # Set worker in automation tab
                 self.automation_tab.set_worker(self.worker)
 
                 logger.info("Automation worker initialized")
 
-            # Start the worker
-            self.worker.start()
+            if self.worker_thread.isRunning():
+                logger.warning("Worker already running")
+                return
+
+            # Start the worker thread; its started signal runs the worker
+            self.worker_thread.start()
             self.update_worker_status("Running", True)
             logger.info("Automation worker started")
 
@@ -858,32 +983,41 @@ class MainWindow(QMainWindow):
     def stop_worker(self):
         """Stop the automation worker"""
         try:
-            if not self.worker or not self.worker.isRunning():
+            if not self.worker or not self.worker_thread.isRunning():
                 logger.warning("Worker not running")
                 return
 
-            # Stop the worker
+            # Ask the worker to stop; _on_worker_stopped runs when it finishes
             self.worker.stop()
-
-            # Wait for the worker to finish with timeout
-            if not self.worker.wait(2000):
-                logger.warning("Worker not responding, forcing termination")
-                self.worker.terminate()
-                self.worker.wait()
-
-            # Update status
-            self.update_worker_status("Stopped", False, False)
-            self.log_tab.add_log("Worker stopped")
-            logger.info("Worker stopped")
+            QTimer.singleShot(2000, self._check_worker_stopped)
 
         except Exception as e:
             logger.error(f"Error stopping worker: {e}")
             self.log_tab.add_log(f"Error stopping worker: {e}")
 
+    def _check_worker_stopped(self):
+        """Report a worker that is still finishing its current task"""
+        if self.worker_thread and self.worker_thread.isRunning():
+            logger.warning("Worker still finishing its current task")
+
+    def _on_worker_stopped(self):
+        """Handle the worker thread finishing"""
+        self.update_worker_status("Stopped", False, False)
+        self.log_tab.add_log("Worker stopped")
+        logger.info("Worker stopped")
+
+        if self._pending_restore:
+            file_name, self._pending_restore = self._pending_restore, None
+            self._start_restore(file_name)
+
+        if self._close_pending:
+            self._close_pending = False
+            self.close()
+
     def pause_worker(self):
         """Pause the automation worker"""
         try:
-            if not self.worker or not self.worker.isRunning():
+            if not self.worker or not self.worker_thread.isRunning():
                 logger.warning("Worker not running")
                 return
 
@@ -902,7 +1036,7 @@ class MainWindow(QMainWindow):
     def resume_worker(self):
         """Resume the automation worker"""
         try:
-            if not self.worker or not self.worker.isRunning():
+            if not self.worker or not self.worker_thread.isRunning():
                 logger.warning("Worker not running")
                 return
 
@@ -920,82 +1054,49 @@ class MainWindow(QMainWindow):
 
     def force_content_generation(self):
         """Force content generation now"""
-        if self.worker and self.worker.isRunning() and not self.worker.paused:
-            try:
-                self.log_tab.add_log("Forcing content generation...")
-                self.worker.daily_content_generation()
-            except Exception as e:
-                logger.error(f"Error forcing content generation: {e}")
-                self.log_tab.add_log(f"Error forcing content generation: {e}")
-        else:
-            QMessageBox.warning(
-                self,
-                "Worker Not Running",
-                "The worker must be running to execute tasks.",
-            )
+        self._force_tasks(
+            "Forcing content generation...",
+            ["generate_content"],
+            "forcing content generation",
+        )
 
     def force_trend_analysis(self):
         """Force trend analysis now"""
-        if self.worker and self.worker.isRunning() and not self.worker.paused:
-            try:
-                self.log_tab.add_log("Forcing trend analysis...")
-                self.worker.pinterest_trend_analysis()
-            except Exception as e:
-                logger.error(f"Error forcing trend analysis: {e}")
-                self.log_tab.add_log(f"Error forcing trend analysis: {e}")
-        else:
-            QMessageBox.warning(
-                self,
-                "Worker Not Running",
-                "The worker must be running to execute tasks.",
-            )
+        self._force_tasks(
+            "Forcing trend analysis...", ["analyze_trends"], "forcing trend analysis"
+        )
 
     def force_publish(self):
         """Force content publishing now"""
-        if self.worker and self.worker.isRunning() and not self.worker.paused:
-            try:
-                self.log_tab.add_log("Forcing content publishing...")
-                self.worker.publish_content()
-            except Exception as e:
-                logger.error(f"Error forcing content publishing: {e}")
-                self.log_tab.add_log(f"Error forcing content publishing: {e}")
-        else:
-            QMessageBox.warning(
-                self,
-                "Worker Not Running",
-                "The worker must be running to execute tasks.",
-            )
+        self._force_tasks(
+            "Forcing content publishing...",
+            ["publish_to_wordpress", "share_on_pinterest"],
+            "forcing content publishing",
+        )
 
     def force_stats_update(self):
         """Force stats update now"""
-        if self.worker and self.worker.isRunning() and not self.worker.paused:
-            try:
-                self.log_tab.add_log("Forcing stats update...")
-                self.worker.update_stats()
-            except Exception as e:
-                logger.error(f"Error forcing stats update: {e}")
-                self.log_tab.add_log(f"Error forcing stats update: {e}")
-        else:
-            QMessageBox.warning(
-                self,
-                "Worker Not Running",
-                "The worker must be running to execute tasks.",
-            )
+        self._force_tasks(
+            "Forcing stats update...", ["collect_stats"], "forcing stats update"
+        )
 
     def force_run_all(self):
         """Force run all scheduled tasks now"""
-        if self.worker and self.worker.isRunning() and not self.worker.paused:
+        self._force_tasks("Forcing all tasks...", None, "forcing all tasks")
+
+    def _force_tasks(self, message, task_names, action):
+        """Queue tasks ahead of scheduled work (all tasks if task_names is None)"""
+        if self._worker_state is WorkerState.RUNNING:
             try:
-                self.log_tab.add_log("Forcing all tasks...")
-                self.worker.daily_content_generation()
-                self.worker.pinterest_trend_analysis()
-                self.worker.publish_content()
-                self.worker.update_stats()
-                self.worker.weekly_analysis()
-                self.worker.health_check()
+                self.log_tab.add_log(message)
+                if task_names is None:
+                    task_names = list(self.worker.task_configs)
+                for task_name in task_names:
+                    # queue_task defaults to the user-initiated priority
+                    self.worker.queue_task(task_name)
             except Exception as e:
-                logger.error(f"Error forcing all tasks: {e}")
-                self.log_tab.add_log(f"Error forcing all tasks: {e}")
+                logger.error(f"Error {action}: {e}")
+                self.log_tab.add_log(f"Error {action}: {e}")
         else:
             QMessageBox.warning(
                 self,
@@ -1010,12 +1111,15 @@ class MainWindow(QMainWindow):
                 logger.warning("Web server already running")
                 return
 
+            from src.utils.api_server import ApiServer
+
             # Get configuration
             port = int(self.config.get("WEB_SERVER_PORT", "5000"))
 
-            # Create and start the server
-            self.api_server = ApiServer(port=port)
-            self.api_server.start()
+            # Create and start the server; only keep it once it is listening
+            api_server = ApiServer(port=port)
+            api_server.start()
+            self.api_server = api_server
 
             # Update status
             self.log_tab.add_log(f"Web server started on port {port}")
@@ -1105,9 +1209,13 @@ class MainWindow(QMainWindow):
     def backup_database(self):
         """Backup the database"""
         try:
+            if self.copy_thread and self.copy_thread.isRunning():
+                logger.warning("Database copy already in progress")
+                return
+
             # Get backup file path
             options = QFileDialog.Options()
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             default_name = f"autopinner_backup_{timestamp}.db"
 
             file_name, _ = QFileDialog.getSaveFileName(
@@ -1121,33 +1229,49 @@ class MainWindow(QMainWindow):
             if not file_name:
                 return  # User cancelled
 
-            # Close database connections
-            if self.db:
-                self.db.close_all()
-
-            # Copy database file
-            import shutil
-
+            # Copy the live database in the background with the online backup API
             db_path = self.config.get("DB_PATH", "autopinner.db")
-            shutil.copy2(db_path, file_name)
+            self.statusBar().showMessage("Backing up database...")
+            self.copy_thread = FileCopyThread(
+                db_path, file_name, self, copy_func=backup_sqlite_database
+            )
+            self.copy_thread.copy_finished.connect(
+                lambda success, error: self.on_backup_finished(
+                    file_name, success, error
+                ),
+                Qt.QueuedConnection,
+            )
+            self.copy_thread.start()
 
-            # Reopen database
-            self.db = DBManager()
+        except Exception as e:
+            logger.error(f"Error backing up database: {e}")
+            QMessageBox.critical(
+                self, "Backup Error", f"Failed to backup database: {str(e)}"
+            )
 
+    def on_backup_finished(self, file_name, success, error):
+        """Handle completion of the background database backup"""
+        self.statusBar().clearMessage()
+
+        if success:
             QMessageBox.information(
                 self, "Backup Complete", f"Database has been backed up to {file_name}"
             )
             logger.info(f"Database backed up to {file_name}")
-
-        except Exception as e:
-            logger.error(f"Error backing up database: {e}")
+        else:
             QMessageBox.critical(
-                self, "Backup Error", f"Failed to backup database: {str(e)}"
+                self, "Backup Error", f"Failed to backup database: {error}"
             )
 
     def restore_database(self):
         """Restore the database from a backup"""
         try:
+            if self._pending_restore or (
+                self.copy_thread and self.copy_thread.isRunning()
+            ):
+                logger.warning("Database copy already in progress")
+                return
+
             # Get restore file path
             options = QFileDialog.Options()
             file_name, _ = QFileDialog.getOpenFileName(
@@ -1173,35 +1297,39 @@ class MainWindow(QMainWindow):
             if reply != QMessageBox.Yes:
                 return
 
-            # Stop worker and web server
-            if self.worker and self.worker.isRunning():
-                self.stop_worker()
-
             if self.api_server:
                 self.stop_web_server()
 
+            # The worker may still be using a session; restore once it stops
+            if self.worker and self.worker_thread.isRunning():
+                self._pending_restore = file_name
+                self.statusBar().showMessage("Waiting for the worker to stop...")
+                self.stop_worker()
+                return
+
+            self._start_restore(file_name)
+
+        except Exception as e:
+            logger.error(f"Error restoring database: {e}")
+            QMessageBox.critical(
+                self, "Restore Error", f"Failed to restore database: {str(e)}"
+            )
+
+    def _start_restore(self, file_name):
+        """Close database connections and copy the backup into place"""
+        try:
             # Close database connections
             if self.db:
                 self.db.close_all()
 
-            # Copy backup file to database location
-            import shutil
-
+            # Copy backup file to database location in the background
             db_path = self.config.get("DB_PATH", "autopinner.db")
-            shutil.copy2(file_name, db_path)
-
-            # Reopen database
-            self.db = DBManager()
-
-            QMessageBox.information(
-                self,
-                "Restore Complete",
-                "Database has been restored. The application will now restart.",
+            self.statusBar().showMessage("Restoring database...")
+            self.copy_thread = FileCopyThread(file_name, db_path, self)
+            self.copy_thread.copy_finished.connect(
+                self.on_restore_finished, Qt.QueuedConnection
             )
-            logger.info("Database restored, application restarting")
-
-            # Restart application
-            self.restart_application()
+            self.copy_thread.start()
 
         except Exception as e:
             logger.error(f"Error restoring database: {e}")
@@ -1209,6 +1337,28 @@ class MainWindow(QMainWindow):
                 self, "Restore Error", f"Failed to restore database: {str(e)}"
             )
 
+    def on_restore_finished(self, success, error):
+        """Handle completion of the background database restore"""
+        # Reopen database
+        self.db = DBManager()
+        self.statusBar().clearMessage()
+
+        if not success:
+            QMessageBox.critical(
+                self, "Restore Error", f"Failed to restore database: {error}"
+            )
+            return
+
+        QMessageBox.information(
+            self,
+            "Restore Complete",
+            "Database has been restored. The application will now restart.",
+        )
+        logger.info("Database restored, application restarting")
+
+        # Restart application
+        self.restart_application()
+
     def clear_logs(self):
         """Clear application logs"""
         reply = QMessageBox.question(
@@ -1225,7 +1375,7 @@ class MainWindow(QMainWindow):
                 self.log_tab.clear_logs()
 
                 # Clear log file
-                open("autopinner.log", "w").close()
+                self.truncate_log_file("autopinner.log")
 
                 logger.info("Logs cleared")
             except Exception as e:
@@ -1234,41 +1384,67 @@ class MainWindow(QMainWindow):
                     self, "Clear Error", f"Failed to clear logs: {str(e)}"
                 )
 
+    def truncate_log_file(self, log_path):
+        """Truncate a log file, holding the lock of any handler writing to it"""
+        log_path = os.path.abspath(log_path)
+        for handler in logging.getLogger().handlers:
+            if (
+                isinstance(handler, logging.FileHandler)
+                and handler.baseFilename == log_path
+            ):
+                handler.acquire()
+                try:
+                    os.truncate(log_path, 0)
+                    if handler.stream:
+                        handler.stream.seek(0)
+                finally:
+                    handler.release()
+                return
+
+        if os.path.exists(log_path):
+            os.truncate(log_path, 0)
+
     def optimize_database(self):
         """Optimize the database"""
         try:
             # Show progress dialog
-            progress = QMessageBox(self)
-            progress.setWindowTitle("Database Optimization")
-            progress.setText("Optimizing database...")
-            progress.setStandardButtons(QMessageBox.NoButton)
-            progress.show()
-
-            # Close all current connections
-            if self.db:
-                self.db.close_all()
-
-            # Run VACUUM on database
-            conn = sqlite3.connect(self.config.get("DB_PATH", "autopinner.db"))
-            conn.execute("VACUUM")
-            conn.execute("PRAGMA optimize")
-            conn.close()
+            self.optimize_progress = QProgressDialog(
+                "Optimizing database...", None, 0, 100, self
+            )
+            self.optimize_progress.setWindowTitle("Database Optimization")
+            self.optimize_progress.setWindowModality(Qt.WindowModal)
+            self.optimize_progress.setMinimumDuration(0)
+            self.optimize_progress.setValue(0)
+
+            # Run VACUUM on a pool thread so the event loop keeps running
+            task = VacuumTask(self.config.get("DB_PATH", "autopinner.db"))
+            task.signals.progress.connect(
+                self.optimize_progress.setValue, Qt.QueuedConnection
+            )
+            task.signals.finished.connect(
+                self.on_optimize_finished, Qt.QueuedConnection
+            )
+            QThreadPool.globalInstance().start(task)
 
-            # Reopen database
-            self.db = DBManager()
+        except Exception as e:
+            logger.error(f"Error optimizing database: {e}")
+            QMessageBox.critical(
+                self, "Optimization Error", f"Failed to optimize database: {str(e)}"
+            )
 
-            # Close progress dialog
-            progress.close()
+    def on_optimize_finished(self, success, error):
+        """Handle completion of the background database optimization"""
+        # Close progress dialog
+        self.optimize_progress.close()
 
+        if success:
             QMessageBox.information(
                 self, "Optimization Complete", "Database has been optimized."
             )
             logger.info("Database optimized")
-
-        except Exception as e:
-            logger.error(f"Error optimizing database: {e}")
+        else:
             QMessageBox.critical(
-                self, "Optimization Error", f"Failed to optimize database: {str(e)}"
+                self, "Optimization Error", f"Failed to optimize database: {error}"
             )
 
     def open_docs(self):
@@ -1299,25 +1475,43 @@ class MainWindow(QMainWindow):
         os.execl(python, python, *sys.argv)
 
     def setup_cleanup_timer(self):
+        self._proc = psutil.Process()
+        self._last_gc_counts = gc.get_count()
         self.cleanup_timer = QTimer()
         self.cleanup_timer.timeout.connect(self.periodic_cleanup)
         self.cleanup_timer.start(300000)  # Run cleanup every 5 minutes
 
     def periodic_cleanup(self):
         try:
-            # Clear any unused resources
-            gc.collect()
+            # Only walk the old generation when it has grown past the
+            # interpreter's own gen-2 threshold; otherwise collect young objects
+            counts = gc.get_count()
+            if counts[2] - self._last_gc_counts[2] < gc.get_threshold()[2]:
+                gc.collect(0)
+            else:
+                gc.collect()
+            self._last_gc_counts = gc.get_count()
 
             # Clean up database connections
             db_manager.cleanup()
 
             # Log memory usage
-            memory_info = psutil.Process().memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
+            memory_mb = self._get_rss_mb()
             logger.info(f"Current memory usage: {memory_mb:.2f} MB")
         except Exception as e:
             logger.error(f"Error during periodic cleanup: {e}")
 
+    def _get_rss_mb(self):
+        """Return resident memory in MB, reading /proc directly on Linux"""
+        if sys.platform.startswith("linux"):
+            try:
+                with open("/proc/self/statm", "rb") as f:
+                    rss_pages = int(f.read().split()[1])
+                return rss_pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+            except (OSError, ValueError, IndexError):
+                pass
+        return self._proc.memory_info().rss / 1024 / 1024
+
     def closeEvent(self, event):
         try:
             # Clean up resources
@@ -1325,8 +1519,17 @@ class MainWindow(QMainWindow):
             self.memory_manager.timer.stop()
 
             # Stop worker and web server if running
-            if hasattr(self, "worker") and self.worker:
+            worker_thread = getattr(self, "worker_thread", None)
+            if worker_thread and worker_thread.isRunning():
                 self.worker.stop()
+                if not worker_thread.wait(2000):
+                    # Destroying a running QThread aborts the process, so
+                    # close again once the current task has returned
+                    logger.info("Waiting for the worker to finish before closing")
+                    self._close_pending = True
+                    self._pending_restore = None
+                    event.ignore()
+                    return
 
             if hasattr(self, "api_server") and self.api_server:
                 self.api_server.stop()
@@ -1334,6 +1537,7 @@ class MainWindow(QMainWindow):
             # Clean up database
             if self.db:
                 self.db._perform_cleanup()
+                self.db.shutdown()
 
             # Force garbage collection
             gc.collect()
@@ -1394,6 +1598,9 @@ def main():
         window = MainWindow()
         window.show()
 
+        # Exclude long-lived startup objects from future collections
+        gc.freeze()
+
         # Start event loop
         sys.exit(app.exec_())
 
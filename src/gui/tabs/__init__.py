@@ -1,15 +1,30 @@
-from .dashboard_tab import DashboardTab
-from .content_tab import ContentTab
-from .reports_tab import ReportsTab
-from .templates_tab import TemplatesTab
-from .trends_tab import TrendsTab
-from .automation_tab import AutomationTab
-
-__all__ = [
-    "DashboardTab",
-    "ContentTab",
-    "ReportsTab",
-    "TemplatesTab",
-    "TrendsTab",
-    "AutomationTab",
-]
+import importlib
+
+# Tab classes are imported on first access (PEP 562) to keep startup light
+_LAZY_EXPORTS = {
+    "DashboardTab": ".dashboard_tab",
+    "ContentTab": ".content_tab",
+    "ReportsTab": ".reports_tab",
+    "TemplatesTab": ".templates_tab",
+    "TrendsTab": ".trends_tab",
+    "AutomationTab": ".automation_tab",
+    "WordPressTab": ".wordpress_tab",
+    "PinterestTab": ".pinterest_tab",
+    "SettingsTab": ".settings_tab",
+    "LogTab": ".log_tab",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,34 @@
+from PyQt5.QtWidgets import (
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyle,
+    QApplication,
+)
+from PyQt5.QtCore import Qt, pyqtSignal, QEvent
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Paints a push button in a cell without creating a widget per row"""
+
+    clicked = pyqtSignal(int)  # Model row
+
+    def __init__(self, text: str, parent=None):
+        super().__init__(parent)
+        self.text = text
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(4, 3, -4, -3)
+        button.text = self.text
+        button.state = QStyle.State_Enabled | QStyle.State_Raised
+        QApplication.style().drawControl(QStyle.CE_PushButton, button, painter)
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and option.rect.contains(event.pos())
+        ):
+            self.clicked.emit(index.row())
+            return True
+        return False
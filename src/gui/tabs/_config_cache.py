@@ -0,0 +1,69 @@
+import os
+import threading
+import logging
+
+from src.utils.json_utils import load_json, dump_json
+
+logger = logging.getLogger(__name__)
+
+# Resolved once at import so later working-directory changes cannot move it
+CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.json"
+)
+
+
+class ConfigCache:
+    """Process-wide cache of the parsed GUI config.json
+
+    The file is only re-read when its mtime changes, so tabs that load and
+    save their own sections share one parsed copy.
+    """
+
+    path = CONFIG_PATH
+    _data = None
+    _mtime = None
+    _lock = threading.RLock()
+
+    @classmethod
+    def exists(cls) -> bool:
+        """Return True if the config file exists"""
+        return os.path.exists(cls.path)
+
+    @classmethod
+    def get(cls) -> dict:
+        """Return the parsed config, reloading it if the file changed"""
+        with cls._lock:
+            if not cls.exists():
+                return {}
+            mtime = os.path.getmtime(cls.path)
+            if cls._data is None or mtime != cls._mtime:
+                with open(cls.path, "rb") as f:
+                    cls._data = load_json(f.read())
+                cls._mtime = mtime
+            return cls._data
+
+    @classmethod
+    def update(cls, patch: dict) -> bool:
+        """Replace top-level sections and write the file atomically
+
+        Returns False if there is no config file to update.
+        """
+        with cls._lock:
+            if not cls.exists():
+                return False
+            # The cached dict is authoritative: patch it in place and write
+            # it out without parsing the file again
+            data = cls.get()
+            data.update(patch)
+
+            tmp_path = cls.path + ".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(dump_json(data))
+                os.replace(tmp_path, cls.path)
+            except Exception:
+                # Disk no longer matches the cache; re-read it on next access
+                cls._data = None
+                raise
+            cls._mtime = os.path.getmtime(cls.path)
+            return True
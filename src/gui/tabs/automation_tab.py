@@ -12,9 +12,9 @@ from PyQt5.QtWidgets import (
     QScrollArea,
     QFrame,
     QProgressBar,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
+    QAbstractItemView,
     QDialog,
     QFormLayout,
     QCalendarWidget,
@@ -23,14 +23,217 @@ from PyQt5.QtWidgets import (
     QSplitter,
     QMessageBox,
 )
-from PyQt5.QtCore import Qt, QTimer, QTime, pyqtSignal
+from PyQt5.QtCore import (
+    Qt,
+    QTimer,
+    QTime,
+    QAbstractTableModel,
+    QModelIndex,
+    pyqtSignal,
+)
 from PyQt5.QtGui import QFont, QColor, QPalette, QIcon
 import logging
+import time
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Optional
+from ._button_delegate import ButtonDelegate
 
 logger = logging.getLogger(__name__)
 
+# Task status label styles, keyed by the label's "state" property
+_STATUS_QSS = {
+    "running": "color: #0078D7; font-weight: bold;",
+    "completed": "color: #107C10;",
+    "failed": "color: #D83B01;",
+    "ready": "color: #107C10;",
+    "disabled": "color: #888888;",
+}
+
+# Task statistics line shown next to each task
+_STATS_TEMPLATE = (
+    "Success Rate: {:.1f}% | Avg Runtime: {:.1f}s | Total Runs: {} | Failures: {}"
+)
+
+# Schedule keys and labels for the days of the week
+_DAYS = (
+    ("monday", "Monday"),
+    ("tuesday", "Tuesday"),
+    ("wednesday", "Wednesday"),
+    ("thursday", "Thursday"),
+    ("friday", "Friday"),
+    ("saturday", "Saturday"),
+    ("sunday", "Sunday"),
+)
+
+# Task table row name -> worker task key
+_WORKER_TASKS = {
+    "Content Generation": "generate_content",
+    "WordPress Posting": "publish_to_wordpress",
+    "Pinterest Pinning": "share_on_pinterest",
+}
+
+# Activity log line and the text color for each level
+_LOG_TEMPLATE = (
+    '<span style="color: gray;">[%s]</span> <span style="color: %s;">%s</span>'
+)
+_LOG_COLORS = {"info": "black", "error": "red", "warning": "orange"}
+
+# Status label text -> "state" property value
+_STATUS_STATES = {
+    "Running...": "running",
+    "Completed": "completed",
+    "Failed": "failed",
+    "Ready": "ready",
+    "Disabled": "disabled",
+}
+
+# Single stylesheet installed on AutomationTab for all task status labels
+_STATUS_STYLESHEET = "\n".join(
+    f'QLabel#statusLabel[state="{state}"] {{ {qss} }}'
+    for state, qss in _STATUS_QSS.items()
+)
+
+
+def _tune_table_view(view: QTableView, stretch_column: int = 0):
+    """Use fixed row heights and column widths so inserts don't re-layout"""
+    view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+    view.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    header = view.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    header.setSectionResizeMode(stretch_column, QHeaderView.Stretch)
+
+
+class TaskTableModel(QAbstractTableModel):
+    """Table model for automation tasks, stored as parallel column lists"""
+
+    HEADERS = ["Task", "Status", "Last Run", "Next Run", "Actions"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._statuses = []
+        self._last_run = []
+        self._next_run = []
+        self._colors = []
+        self._row_index = {}  # Task name -> row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return self._names[row]
+            if col == 1:
+                return self._statuses[row]
+            if col == 2:
+                return self._last_run[row]
+            if col == 3:
+                return self._next_run[row]
+            return None
+        if role == Qt.BackgroundRole:
+            return self._colors[row]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def setTasks(self, tasks):
+        """Replace all tasks with a list of task dicts"""
+        self.beginResetModel()
+        self._names = [task["name"] for task in tasks]
+        self._statuses = [task.get("status", "") for task in tasks]
+        self._last_run = [task.get("last_run", "") for task in tasks]
+        self._next_run = [task.get("next_run", "") for task in tasks]
+        self._colors = [None] * len(tasks)
+        self._row_index = {name: row for row, name in enumerate(self._names)}
+        self.endResetModel()
+
+    def appendTask(self, name, status="", last_run="", next_run=""):
+        """Append a single task row"""
+        row = len(self._names)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._names.append(name)
+        self._statuses.append(status)
+        self._last_run.append(last_run)
+        self._next_run.append(next_run)
+        self._colors.append(None)
+        self._row_index[name] = row
+        self.endInsertRows()
+
+    def setStatus(self, row, status, color=None):
+        """Update the status (and optional background color) of a row"""
+        self._statuses[row] = status
+        self._colors[row] = color
+        self.dataChanged.emit(self.index(row, 0), self.index(row, 3))
+
+    def taskName(self, row):
+        return self._names[row]
+
+    def rowForName(self, name):
+        """Return the row of a task, or None if it is not in the model"""
+        return self._row_index.get(name)
+
+
+class HistoryTableModel(QAbstractTableModel):
+    """Table model for task run history, kept in a bounded ring buffer"""
+
+    HEADERS = ["Task", "Started", "Completed", "Status", "Runtime"]
+    MAX_ROWS = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Rows are (task, started, completed, status, runtime, color) tuples
+        self._rows = deque(maxlen=self.MAX_ROWS)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.BackgroundRole:
+            return self._rows[index.row()][5]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def appendEntries(self, entries):
+        """Append history rows in one batch, dropping the oldest beyond MAX_ROWS"""
+        entries = list(entries)[-self.MAX_ROWS :]
+        if not entries:
+            return
+
+        excess = len(self._rows) + len(entries) - self.MAX_ROWS
+        if excess > 0:
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            for _ in range(excess):
+                self._rows.popleft()
+            self.endRemoveRows()
+
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(entries) - 1)
+        self._rows.extend(entries)
+        self.endInsertRows()
+
 
 class TaskConfigDialog(QDialog):
     """Dialog for configuring task settings"""
@@ -44,6 +247,7 @@ class TaskConfigDialog(QDialog):
     def init_ui(self):
         """Initialize the dialog UI"""
         self.setWindowTitle(f"Configure {self.task_name}")
+        self.setUpdatesEnabled(False)
         layout = QVBoxLayout()
 
         # Schedule configuration
@@ -51,20 +255,12 @@ class TaskConfigDialog(QDialog):
         schedule_layout = QVBoxLayout()
 
         # Days of week
-        days = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-        self.day_checkboxes = {}
-        for day in days:
-            cb = QCheckBox(day)
-            cb.setChecked(self.task_config.schedule.get(day.lower(), True))
-            self.day_checkboxes[day.lower()] = cb
+        schedule = self.task_config.schedule
+        self.day_checkboxes = []
+        for key, label in _DAYS:
+            cb = QCheckBox(label)
+            cb.setChecked(schedule.get(key, True))
+            self.day_checkboxes.append((key, cb))
             schedule_layout.addWidget(cb)
 
         schedule_group.setLayout(schedule_layout)
@@ -97,13 +293,12 @@ class TaskConfigDialog(QDialog):
         layout.addWidget(buttons)
 
         self.setLayout(layout)
+        self.setUpdatesEnabled(True)
 
     def get_config(self):
         """Get the updated configuration"""
         return {
-            "schedule": {
-                day: cb.isChecked() for day, cb in self.day_checkboxes.items()
-            },
+            "schedule": {key: cb.isChecked() for key, cb in self.day_checkboxes},
             "retry_count": self.retry_spin.value(),
             "timeout": self.timeout_spin.value(),
         }
@@ -120,6 +315,8 @@ class TaskWidget(QFrame):
         self.description = description
         self.enabled = False
         self.status = "Disabled"  # Add status attribute
+        self._last_progress = None
+        self._last_stats_tuple = None
         self.init_ui()
 
     def init_ui(self):
@@ -152,7 +349,8 @@ class TaskWidget(QFrame):
 
         # Status indicator
         self.status_label = QLabel(self.status)
-        self.status_label.setStyleSheet("color: #888888;")
+        self.status_label.setObjectName("statusLabel")
+        self.status_label.setProperty("state", "disabled")
         layout.addWidget(self.status_label)
 
         # Stats label
@@ -202,51 +400,51 @@ class TaskWidget(QFrame):
             self.progress_bar.setValue(50)  # Indicate progress
             self.parent().run_task(self.task_name)
 
-    def update_status(self, status: str, color: str = None):
+    def update_status(self, status: str):
         """Update the status display"""
+        if status == self.status:
+            return
         self.status = status
         self.status_label.setText(status)
 
         # Update status color based on state
-        if color:
-            self.status_label.setStyleSheet(f"color: {color};")
-        elif status == "Running...":
-            self.status_label.setStyleSheet("color: #0078D7; font-weight: bold;")
-        elif status == "Completed":
-            self.status_label.setStyleSheet("color: #107C10;")
-        elif status == "Failed":
-            self.status_label.setStyleSheet("color: #D83B01;")
-        elif status == "Ready":
-            self.status_label.setStyleSheet("color: #107C10;")
-        else:
-            self.status_label.setStyleSheet("color: #888888;")
+        state = _STATUS_STATES.get(status, "disabled")
+
+        # Re-polish so the tab stylesheet's [state=...] selector applies
+        self.status_label.setProperty("state", state)
+        self.status_label.style().unpolish(self.status_label)
+        self.status_label.style().polish(self.status_label)
 
     def update_progress(self, progress: int, message: str):
         """Update task progress"""
-        self.progress = progress
-        self.progress_bar.setValue(progress)
-        self.progress_bar.setVisible(progress > 0)
+        if progress != self._last_progress:
+            self._last_progress = progress
+            self.progress_bar.setValue(progress)
+            self.progress_bar.setVisible(progress > 0)
         if message:
             self.status_label.setText(f"{self.status} - {message}")
 
     def update_stats(self, stats: dict):
         """Update task statistics"""
         if not stats:
-            self.stats_label.setText("")
+            if self._last_stats_tuple is not None:
+                self._last_stats_tuple = None
+                self.stats_label.setText("")
             return
 
-        success_rate = stats.get("success_rate", 0)
-        avg_runtime = stats.get("avg_runtime", 0)
-        total_runs = stats.get("total_runs", 0)
-        failures = stats.get("failures", 0)
-
-        stats_text = (
-            f"Success Rate: {success_rate:.1f}% | "
-            f"Avg Runtime: {avg_runtime:.1f}s | "
-            f"Total Runs: {total_runs} | "
-            f"Failures: {failures}"
+        # Worker stats carry counts and total runtime; derive the display values
+        failures = stats.get("failures", stats.get("failure_count", 0))
+        total_runs = stats.get("total_runs", stats.get("success_count", 0) + failures)
+        avg_runtime = stats.get(
+            "avg_runtime",
+            stats.get("total_runtime", 0) / total_runs if total_runs else 0,
         )
-        self.stats_label.setText(stats_text)
+        key = (stats.get("success_rate", 0), avg_runtime, total_runs, failures)
+        if key == self._last_stats_tuple:
+            return
+
+        self._last_stats_tuple = key
+        self.stats_label.setText(_STATS_TEMPLATE.format(*key))
 
 
 class AutomationTab(QWidget):
@@ -257,16 +455,21 @@ class AutomationTab(QWidget):
         self.parent = parent
         self.worker = None
         self.tasks = {}
+        self._pending_history = []
+        self._last_status = None
+        self._deferred_progress = {}
+        self._paused = False
+        self._ts_cache_sec = None
+        self._ts_cache_str = ""
+        self._log_queue = []
+        self.setStyleSheet(_STATUS_STYLESHEET)
         self.init_ui()
         self.load_tasks()
 
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(1000)  # Update every second
-
     def init_ui(self):
         """Initialize the UI"""
+        # Suppress repaints while the groups are assembled
+        self.setUpdatesEnabled(False)
         layout = QVBoxLayout()
         layout.setSpacing(20)
 
@@ -323,17 +526,47 @@ class AutomationTab(QWidget):
         status_layout = QVBoxLayout()
 
         # Task Table
-        self.task_table = QTableWidget()
-        self.task_table.setColumnCount(5)
-        self.task_table.setHorizontalHeaderLabels(
-            ["Task", "Status", "Last Run", "Next Run", "Actions"]
-        )
-        self.task_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.task_model = TaskTableModel(self)
+        self.task_table = QTableView()
+        self.task_table.setModel(self.task_model)
+        self.task_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.action_delegate = ButtonDelegate("Run Now", self.task_table)
+        self.action_delegate.clicked.connect(self._on_run_clicked)
+        self.task_table.setItemDelegateForColumn(4, self.action_delegate)
+        _tune_table_view(self.task_table)
         status_layout.addWidget(self.task_table)
 
         status_group.setLayout(status_layout)
         layout.addWidget(status_group)
 
+        # Task History Group
+        history_group = QGroupBox("Task History")
+        history_layout = QVBoxLayout()
+
+        self.history_model = HistoryTableModel(self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
+        self.history_table.setEditTriggers(QTableView.NoEditTriggers)
+        _tune_table_view(self.history_table)
+        history_layout.addWidget(self.history_table)
+
+        history_group.setLayout(history_layout)
+        layout.addWidget(history_group)
+
+        # Activity Log Group
+        log_group = QGroupBox("Activity Log")
+        log_layout = QVBoxLayout()
+
+        self.log_viewer = QTextEdit()
+        self.log_viewer.setReadOnly(True)
+        self.log_viewer.setUndoRedoEnabled(False)
+        # Qt drops the oldest lines itself once the cap is reached
+        self.log_viewer.document().setMaximumBlockCount(500)
+        log_layout.addWidget(self.log_viewer)
+
+        log_group.setLayout(log_layout)
+        layout.addWidget(log_group)
+
         # Control Buttons
         button_layout = QHBoxLayout()
 
@@ -347,7 +580,7 @@ class AutomationTab(QWidget):
         button_layout.addWidget(self.stop_button)
 
         self.pause_button = QPushButton("Pause")
-        self.pause_button.clicked.connect(self.pause_automation)
+        self.pause_button.clicked.connect(self.toggle_pause)
         self.pause_button.setEnabled(False)
         button_layout.addWidget(self.pause_button)
 
@@ -359,6 +592,7 @@ class AutomationTab(QWidget):
         layout.addWidget(self.progress_bar)
 
         self.setLayout(layout)
+        self.setUpdatesEnabled(True)
 
     def load_tasks(self):
         """Load task configurations"""
@@ -390,10 +624,6 @@ class AutomationTab(QWidget):
     def update_task_table(self):
         """Update the task table with current status"""
         try:
-            # Clear table
-            self.task_table.setRowCount(0)
-
-            # Add tasks
             tasks = [
                 {
                     "name": "Content Generation",
@@ -415,40 +645,8 @@ class AutomationTab(QWidget):
                 },
             ]
 
-            for task in tasks:
-                row = self.task_table.rowCount()
-                self.task_table.insertRow(row)
-
-                # Task name
-                name_item = QTableWidgetItem(task["name"])
-                name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-                self.task_table.setItem(row, 0, name_item)
-
-                # Status
-                status_item = QTableWidgetItem(task["status"])
-                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-                self.task_table.setItem(row, 1, status_item)
-
-                # Last run
-                last_run_item = QTableWidgetItem(task["last_run"])
-                last_run_item.setFlags(last_run_item.flags() & ~Qt.ItemIsEditable)
-                self.task_table.setItem(row, 2, last_run_item)
-
-                # Next run
-                next_run_item = QTableWidgetItem(task["next_run"])
-                next_run_item.setFlags(next_run_item.flags() & ~Qt.ItemIsEditable)
-                self.task_table.setItem(row, 3, next_run_item)
-
-                # Action buttons
-                action_widget = QWidget()
-                action_layout = QHBoxLayout(action_widget)
-                action_layout.setContentsMargins(0, 0, 0, 0)
-
-                run_button = QPushButton("Run Now")
-                run_button.clicked.connect(lambda: self.run_task(task["name"]))
-                action_layout.addWidget(run_button)
-
-                self.task_table.setCellWidget(row, 4, action_widget)
+            # Replace the model contents in one reset
+            self.task_model.setTasks(tasks)
 
         except Exception as e:
             logger.error(f"Error updating task table: {e}")
@@ -465,13 +663,13 @@ class AutomationTab(QWidget):
 
             # Start worker
             if self.worker:
-                self.worker.start()
+                self.parent.start_worker()
 
-            QMessageBox.information(self, "Success", "Automation started successfully")
+            self.log("Automation started")
 
         except Exception as e:
             logger.error(f"Error starting automation: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to start automation: {str(e)}")
+            self.show_error(f"Failed to start automation: {str(e)}")
 
     def stop_automation(self):
         """Stop automation tasks"""
@@ -480,91 +678,82 @@ class AutomationTab(QWidget):
             self.start_button.setEnabled(True)
             self.stop_button.setEnabled(False)
             self.pause_button.setEnabled(False)
+            self.pause_button.setText("Pause")
+            self._paused = False
             self.progress_bar.setVisible(False)
 
             # Stop worker
             if self.worker:
-                self.worker.stop()
+                self.parent.stop_worker()
 
-            QMessageBox.information(self, "Success", "Automation stopped successfully")
+            self.log("Automation stopped")
 
         except Exception as e:
             logger.error(f"Error stopping automation: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to stop automation: {str(e)}")
+            self.show_error(f"Failed to stop automation: {str(e)}")
+
+    def toggle_pause(self):
+        """Pause or resume automation depending on the current mode"""
+        if self._paused:
+            self.resume_automation()
+        else:
+            self.pause_automation()
 
     def pause_automation(self):
         """Pause automation tasks"""
         try:
             # Update UI
+            self._paused = True
             self.pause_button.setText("Resume")
-            self.pause_button.clicked.disconnect()
-            self.pause_button.clicked.connect(self.resume_automation)
 
             # Pause worker
             if self.worker:
                 self.worker.pause()
 
-            QMessageBox.information(self, "Success", "Automation paused successfully")
+            self.log("Automation paused")
 
         except Exception as e:
             logger.error(f"Error pausing automation: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to pause automation: {str(e)}")
+            self.show_error(f"Failed to pause automation: {str(e)}")
 
     def resume_automation(self):
         """Resume automation tasks"""
         try:
             # Update UI
+            self._paused = False
             self.pause_button.setText("Pause")
-            self.pause_button.clicked.disconnect()
-            self.pause_button.clicked.connect(self.pause_automation)
 
             # Resume worker
             if self.worker:
                 self.worker.resume()
 
-            QMessageBox.information(self, "Success", "Automation resumed successfully")
+            self.log("Automation resumed")
 
         except Exception as e:
             logger.error(f"Error resuming automation: {e}")
-            QMessageBox.critical(
-                self, "Error", f"Failed to resume automation: {str(e)}"
-            )
+            self.show_error(f"Failed to resume automation: {str(e)}")
+
+    def _on_run_clicked(self, row):
+        """Run the task shown at a row of the task table"""
+        self.run_task(self.task_model.taskName(row))
 
     def run_task(self, task_name: str):
         """Run a specific task immediately"""
         try:
             # Update task status
-            for row in range(self.task_table.rowCount()):
-                if self.task_table.item(row, 0).text() == task_name:
-                    self.task_table.item(row, 1).setText("Running")
-                    break
+            row = self.task_model.rowForName(task_name)
+            if row is not None:
+                self.task_model.setStatus(row, "Running")
 
-            # Run task
+            # Queue the worker task behind this row
             if self.worker:
-                self.worker.run_task(task_name)
+                self.worker.queue_task(_WORKER_TASKS.get(task_name, task_name))
 
-            QMessageBox.information(
-                self, "Success", f"Task {task_name} started successfully"
-            )
+            self.log(f"Task {task_name} started")
 
         except Exception as e:
             logger.error(f"Error running task: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to run task: {str(e)}")
-
-    def update_status(self):
-        """Update status displays"""
-        if self.worker:
-            # Update worker status
-            status = self.worker.get_status()
-            self.start_button.setEnabled(status != "Running")
-            self.stop_button.setEnabled(status == "Running")
-            self.pause_button.setEnabled(status == "Running")
-            self.progress_bar.setVisible(status == "Running")
-
-            # Update task statistics
-            for task_name, task_widget in self.tasks.items():
-                stats = self.worker.get_task_stats(task_name)
-                task_widget.update_stats(stats)
+            self.show_error(f"Failed to run task: {str(e)}")
 
     def set_worker(self, worker):
         """Set the automation worker and connect signals"""
@@ -576,6 +765,7 @@ class AutomationTab(QWidget):
             worker.task_progress.connect(self.on_task_progress)
             worker.error_occurred.connect(self.on_error)
             worker.queue_updated.connect(self.on_queue_updated)
+            worker.stats_updated.connect(self.on_stats_updated)
 
             # Connect task controls
             for task_widget in self.tasks.values():
@@ -589,13 +779,7 @@ class AutomationTab(QWidget):
         """Add a task to the task list"""
         task_widget = TaskWidget(name, description, self)
         self.tasks[name] = task_widget
-        self.task_table.insertRow(self.task_table.rowCount())
-        self.task_table.setItem(
-            self.task_table.rowCount() - 1, 0, QTableWidgetItem(name)
-        )
-        self.task_table.setCellWidget(
-            self.task_table.rowCount() - 1, 4, task_widget.run_btn
-        )
+        self.task_model.appendTask(name)
 
     def configure_task(self, task_name):
         """Open task configuration dialog"""
@@ -616,27 +800,48 @@ class AutomationTab(QWidget):
 
     def on_worker_status_changed(self, status):
         """Handle worker status changes"""
+        if status == self._last_status:
+            return
+        self._last_status = status
+
         self.start_button.setEnabled(status != "Running")
         self.stop_button.setEnabled(status == "Running")
-        self.pause_button.setEnabled(status == "Running")
+        self.pause_button.setEnabled(status in ("Running", "Paused"))
         self.progress_bar.setVisible(status == "Running")
 
     def on_task_completed(self, task_name, success, message):
         """Handle task completion"""
         if task_name in self.tasks:
-            color = "green" if success else "red"
             status = "Completed" if success else "Failed"
             task_widget = self.tasks[task_name]
-            task_widget.update_status(status, color)
+            task_widget.update_status(status)
             task_widget.progress_bar.setVisible(False)
             self.log(f"Task {task_name} {status.lower()}: {message}")
 
             # Update history
             self.add_history_entry(task_name, success, message)
 
+    def on_stats_updated(self, stats_by_task):
+        """Handle task statistics recomputed by the worker"""
+        for task_name, stats in stats_by_task.items():
+            task_widget = self.tasks.get(task_name)
+            if task_widget:
+                task_widget.update_stats(stats)
+
     def on_task_progress(self, task_name, progress, message):
         """Handle task progress updates"""
         if task_name in self.tasks:
+            if not self.isVisible():
+                # Keep only the latest value until the tab is shown again
+                self._deferred_progress[task_name] = (progress, message)
+                return
+            self.tasks[task_name].update_progress(progress, message)
+
+    def showEvent(self, event):
+        """Apply progress that arrived while the tab was hidden"""
+        super().showEvent(event)
+        deferred, self._deferred_progress = self._deferred_progress, {}
+        for task_name, (progress, message) in deferred.items():
             self.tasks[task_name].update_progress(progress, message)
 
     def on_queue_updated(self, queue_items):
@@ -651,46 +856,62 @@ class AutomationTab(QWidget):
         """Handle worker errors"""
         self.log(f"Error: {error_msg}", "error")
 
+    def _timestamp(self):
+        """Return the current time as text, reformatted once per second"""
+        sec = int(time.time())
+        if sec != self._ts_cache_sec:
+            self._ts_cache_sec = sec
+            self._ts_cache_str = datetime.fromtimestamp(sec).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+        return self._ts_cache_str
+
     def add_history_entry(self, task_name, success, message):
-        """Add an entry to the task history table"""
-        row = self.history_table.rowCount()
-        self.history_table.insertRow(row)
-
-        # Add task details
-        self.history_table.setItem(row, 0, QTableWidgetItem(task_name))
-        self.history_table.setItem(
-            row, 1, QTableWidgetItem(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        )
-        self.history_table.setItem(
-            row, 2, QTableWidgetItem(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        )
-        self.history_table.setItem(
-            row, 3, QTableWidgetItem("Success" if success else "Failed")
+        """Queue an entry for the task history table"""
+        now = self._timestamp()
+        self._pending_history.append(
+            (
+                task_name,
+                now,
+                now,
+                "Success" if success else "Failed",
+                "0s",  # Runtime would be calculated from actual timestamps
+                QColor("#d4edda") if success else QColor("#f8d7da"),
+            )
         )
-        self.history_table.setItem(
-            row, 4, QTableWidgetItem("0s")
-        )  # Runtime would be calculated from actual timestamps
-
-        # Set colors
-        for col in range(self.history_table.columnCount()):
-            item = self.history_table.item(row, col)
-            item.setBackground(QColor("#d4edda") if success else QColor("#f8d7da"))
 
-        # Trim history if too long
-        while self.history_table.rowCount() > 100:
-            self.history_table.removeRow(0)
+        # Flush on the next event-loop tick so bursts insert and scroll once
+        if len(self._pending_history) == 1:
+            QTimer.singleShot(0, self._flush_history)
 
-        # Scroll to latest entry
+    def _flush_history(self):
+        """Insert queued history entries and scroll to the latest one"""
+        entries, self._pending_history = self._pending_history, []
+        self.history_model.appendEntries(entries)
         self.history_table.scrollToBottom()
 
-    def log(self, message, level="info"):
-        """Add a message to the log viewer"""
-        color = {"info": "black", "error": "red", "warning": "orange"}.get(
-            level, "black"
-        )
+    def show_error(self, message):
+        """Show a non-modal error dialog and log the error"""
+        self.log(message, "error")
+        box = QMessageBox(QMessageBox.Critical, "Error", message, QMessageBox.Ok, self)
+        box.setWindowModality(Qt.NonModal)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.show()
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_viewer.append(
-            f'<span style="color: gray;">[{timestamp}]</span> '
-            f'<span style="color: {color};">{message}</span>'
-        )
+    def log(self, message, level="info"):
+        """Queue a message for the log viewer"""
+        color = _LOG_COLORS.get(level, "black")
+        timestamp = self._timestamp()[11:]
+        self._log_queue.append(_LOG_TEMPLATE % (timestamp, color, message))
+
+        # Append everything queued during this event-loop tick at once
+        if len(self._log_queue) == 1:
+            QTimer.singleShot(0, self._flush_log_queue)
+
+    def _flush_log_queue(self):
+        """Append queued log lines with a single repaint"""
+        lines, self._log_queue = self._log_queue, []
+        self.log_viewer.setUpdatesEnabled(False)
+        for line in lines:
+            self.log_viewer.append(line)
+        self.log_viewer.setUpdatesEnabled(True)
@@ -7,10 +7,10 @@ from PyQt5.QtWidgets import (
     QTextEdit,
     QLineEdit,
     QComboBox,
-    QListWidget,
+    QListView,
     QMessageBox,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QStringListModel
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,8 @@ class ContentTab(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._editor_built = False
+        self._content_ids = []
         self.init_ui()
 
     def init_ui(self):
@@ -29,8 +31,12 @@ class ContentTab(QWidget):
 
         # Left panel - Content list
         left_panel = QVBoxLayout()
-        self.content_list = QListWidget()
-        self.content_list.itemClicked.connect(self.load_content)
+        self._content_model = QStringListModel(self)
+        self.content_list = QListView()
+        self.content_list.setModel(self._content_model)
+        self.content_list.setUniformItemSizes(True)
+        self.content_list.setEditTriggers(QListView.NoEditTriggers)
+        self.content_list.clicked.connect(self.load_content)
 
         # Content list buttons
         list_buttons = QHBoxLayout()
@@ -46,6 +52,17 @@ class ContentTab(QWidget):
         left_panel.addWidget(self.content_list)
         left_panel.addLayout(list_buttons)
 
+        # Right panel is built on first use by _ensure_editor_built
+        layout.addLayout(left_panel, 1)
+
+        self.setLayout(layout)
+
+    def _ensure_editor_built(self):
+        """Build the content editor panel the first time it is needed"""
+        if self._editor_built:
+            return
+        self._editor_built = True
+
         # Right panel - Content editor
         right_panel = QVBoxLayout()
 
@@ -75,28 +92,31 @@ class ContentTab(QWidget):
         right_panel.addWidget(self.content_edit)
         right_panel.addWidget(self.save_btn)
 
-        # Add panels to main layout
-        layout.addLayout(left_panel, 1)
-        layout.addLayout(right_panel, 2)
+        self.layout().addLayout(right_panel, 2)
 
-        self.setLayout(layout)
+    def showEvent(self, event):
+        """Build the editor when the tab is first shown"""
+        self._ensure_editor_built()
+        super().showEvent(event)
 
     def load_content_list(self):
         """Load content list from database"""
         try:
-            self.content_list.clear()
+            titles = []
+            self._content_ids = []
             # Content loading logic will be implemented here
+            self._content_model.setStringList(titles)
         except Exception as e:
             logger.error(f"Error loading content list: {e}")
             QMessageBox.critical(
                 self, "Error", f"Failed to load content list: {str(e)}"
             )
 
-    def load_content(self, item):
+    def load_content(self, index):
         """Load selected content into editor"""
         try:
+            self._ensure_editor_built()
             # Content loading logic will be implemented here
-            pass
         except Exception as e:
             logger.error(f"Error loading content: {e}")
             QMessageBox.critical(self, "Error", f"Failed to load content: {str(e)}")
@@ -104,6 +124,7 @@ class ContentTab(QWidget):
     def new_content(self):
         """Create new content"""
         try:
+            self._ensure_editor_built()
             self.title_edit.clear()
             self.content_edit.clear()
             self.type_combo.setCurrentIndex(0)
@@ -125,10 +146,12 @@ class ContentTab(QWidget):
     def delete_content(self):
         """Delete selected content"""
         try:
-            current_item = self.content_list.currentItem()
-            if current_item:
+            row = self.content_list.currentIndex().row()
+            if row >= 0:
                 # Content deletion logic will be implemented here
-                self.content_list.takeItem(self.content_list.row(current_item))
+                self._content_model.removeRow(row)
+                if row < len(self._content_ids):
+                    del self._content_ids[row]
         except Exception as e:
             logger.error(f"Error deleting content: {e}")
             QMessageBox.critical(self, "Error", f"Failed to delete content: {str(e)}")
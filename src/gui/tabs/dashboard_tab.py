@@ -11,15 +11,57 @@ from PyQt5.QtWidgets import (
     QScrollArea,
     QSizePolicy,
 )
-from PyQt5.QtCore import Qt, QSize, QTimer
+from PyQt5.QtCore import (
+    Qt,
+    QSize,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt5.QtGui import QColor, QPalette, QFont, QIcon
 import datetime
 import logging
+import time
 from typing import Optional
+from sqlalchemy import case, func
 from src.utils.database import Pin
 
 logger = logging.getLogger(__name__)
 
+# Pin counts are reused across refreshes for this many seconds
+_STATS_TTL = 60
+_stats_cache = {"ts": 0.0, "data": None}
+
+
+class StatsSignals(QObject):
+    """Signal bridge for StatsWorker (QRunnable cannot emit signals itself)"""
+
+    finished = pyqtSignal(dict, dict)  # Pinterest stats, WordPress stats
+
+
+class StatsWorker(QRunnable):
+    """Fetches Pinterest and WordPress stats on a thread pool thread"""
+
+    def __init__(self, fetch_pinterest, fetch_wordpress):
+        super().__init__()
+        self.fetch_pinterest = fetch_pinterest  # None when not connected
+        self.fetch_wordpress = fetch_wordpress
+        self.signals = StatsSignals()
+
+    def run(self):
+        pinterest_stats, wordpress_stats = {}, {}
+        try:
+            if self.fetch_pinterest:
+                pinterest_stats = self.fetch_pinterest()
+            wordpress_stats = self.fetch_wordpress()
+        except Exception as e:
+            logger.error(f"Error fetching dashboard stats: {e}")
+        finally:
+            # Always report back so the dashboard can schedule the next fetch
+            self.signals.finished.emit(pinterest_stats, wordpress_stats)
+
 
 class StatCard(QFrame):
     """A card widget for displaying statistics"""
@@ -126,11 +168,20 @@ class DashboardTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
+        self._today = None
+        self._today_start = None
+        self._fetching_stats = False
+        self._last_worker_state = None
+        self._last_server_state = None
         self.init_ui()
         self.setup_timer()
 
     def set_worker_status(self, running: bool, paused: bool = False):
         """Update the worker status display"""
+        if (running, paused) == self._last_worker_state:
+            return
+        self._last_worker_state = (running, paused)
+
         if running:
             if paused:
                 self.worker_status.setText("Worker: Paused")
@@ -142,6 +193,19 @@ class DashboardTab(QWidget):
             self.worker_status.setText("Worker: Not Running")
             self.worker_status.setStyleSheet("color: gray;")
 
+    def set_web_server_status(self, running: bool):
+        """Update the web server status display"""
+        if running == self._last_server_state:
+            return
+        self._last_server_state = running
+
+        if running:
+            self.server_status.setText("Web Server: Running")
+            self.server_status.setStyleSheet("color: green;")
+        else:
+            self.server_status.setText("Web Server: Stopped")
+            self.server_status.setStyleSheet("color: gray;")
+
     def init_ui(self):
         """Initialize the UI"""
         layout = QVBoxLayout()
@@ -194,37 +258,9 @@ class DashboardTab(QWidget):
         content_group.setLayout(content_layout)
         layout.addWidget(content_group)
 
-        # Pinterest Statistics
-        self.pinterest_group = QGroupBox("Pinterest Statistics")
-        pinterest_layout = QGridLayout()
-
-        # Total Pins
-        self.total_pins = QLabel("0")
-        self.total_pins.setFont(QFont("Arial", 24, QFont.Bold))
-        pinterest_layout.addWidget(QLabel("Total Pins:"), 0, 0)
-        pinterest_layout.addWidget(self.total_pins, 0, 1)
-
-        # Pins Today
-        self.pins_today = QLabel("0")
-        self.pins_today.setFont(QFont("Arial", 24, QFont.Bold))
-        pinterest_layout.addWidget(QLabel("Pins Today:"), 1, 0)
-        pinterest_layout.addWidget(self.pins_today, 1, 1)
-
-        # Total Saves
-        self.total_saves = QLabel("0")
-        self.total_saves.setFont(QFont("Arial", 24, QFont.Bold))
-        pinterest_layout.addWidget(QLabel("Total Saves:"), 2, 0)
-        pinterest_layout.addWidget(self.total_saves, 2, 1)
-
-        # Total Clicks
-        self.total_clicks = QLabel("0")
-        self.total_clicks.setFont(QFont("Arial", 24, QFont.Bold))
-        pinterest_layout.addWidget(QLabel("Total Clicks:"), 3, 0)
-        pinterest_layout.addWidget(self.total_clicks, 3, 1)
-
-        self.pinterest_group.setLayout(pinterest_layout)
-        layout.addWidget(self.pinterest_group)
-        self.pinterest_group.setVisible(False)  # Initially hidden
+        # Pinterest Statistics are built on first use by _build_pinterest_group
+        self.pinterest_group = None
+        self._pinterest_group_index = layout.count()
 
         # WordPress Statistics
         wordpress_group = QGroupBox("WordPress Statistics")
@@ -258,67 +294,141 @@ class DashboardTab(QWidget):
 
         self.setLayout(layout)
 
+    def _build_pinterest_group(self):
+        """Create the Pinterest statistics group once an account is connected"""
+        self.pinterest_group = QGroupBox("Pinterest Statistics")
+        pinterest_layout = QGridLayout()
+
+        # Total Pins
+        self.total_pins = QLabel("0")
+        self.total_pins.setFont(QFont("Arial", 24, QFont.Bold))
+        pinterest_layout.addWidget(QLabel("Total Pins:"), 0, 0)
+        pinterest_layout.addWidget(self.total_pins, 0, 1)
+
+        # Pins Today
+        self.pins_today = QLabel("0")
+        self.pins_today.setFont(QFont("Arial", 24, QFont.Bold))
+        pinterest_layout.addWidget(QLabel("Pins Today:"), 1, 0)
+        pinterest_layout.addWidget(self.pins_today, 1, 1)
+
+        # Total Saves
+        self.total_saves = QLabel("0")
+        self.total_saves.setFont(QFont("Arial", 24, QFont.Bold))
+        pinterest_layout.addWidget(QLabel("Total Saves:"), 2, 0)
+        pinterest_layout.addWidget(self.total_saves, 2, 1)
+
+        # Total Clicks
+        self.total_clicks = QLabel("0")
+        self.total_clicks.setFont(QFont("Arial", 24, QFont.Bold))
+        pinterest_layout.addWidget(QLabel("Total Clicks:"), 3, 0)
+        pinterest_layout.addWidget(self.total_clicks, 3, 1)
+
+        self.pinterest_group.setLayout(pinterest_layout)
+        self.layout().insertWidget(self._pinterest_group_index, self.pinterest_group)
+
     def setup_timer(self):
         """Setup timer for periodic updates"""
         self.timer = QTimer()
+        self.timer.setInterval(30000)  # Update every 30 seconds
         self.timer.timeout.connect(self.update_stats)
-        self.timer.start(30000)  # Update every 30 seconds
+        # Started and stopped by showEvent/hideEvent
+
+        # Fill in initial stats once pending window events have been processed
+        QTimer.singleShot(0, self.update_stats)
+
+    def showEvent(self, event):
+        """Resume periodic updates while the dashboard is on screen"""
+        super().showEvent(event)
+        self.timer.start()
+
+    def hideEvent(self, event):
+        """Stop periodic updates while another tab is shown"""
+        super().hideEvent(event)
+        self.timer.stop()
 
     def update_stats(self):
         """Update dashboard statistics"""
+        # Apply all label changes with a single repaint
+        self.setUpdatesEnabled(False)
         try:
-            # Update system status
-            if self.parent.worker and self.parent.worker.isRunning():
-                self.worker_status.setText("Worker: Running")
-                self.worker_status.setStyleSheet("color: green;")
-            else:
-                self.worker_status.setText("Worker: Not Running")
-                self.worker_status.setStyleSheet("color: gray;")
-
-            if self.parent.api_server:
-                self.server_status.setText("Web Server: Running")
-                self.server_status.setStyleSheet("color: green;")
+            # Update system status; labels only change on a state transition
+            worker = self.parent.worker
+            if worker and worker.running:
+                self.set_worker_status(True, worker.paused)
             else:
-                self.server_status.setText("Web Server: Stopped")
-                self.server_status.setStyleSheet("color: gray;")
+                self.set_worker_status(False)
+            self.set_web_server_status(bool(self.parent.api_server))
 
             # Update content statistics
-            with self.parent.db.get_session() as session:
-                # Total posts
-                total_posts = session.query(Pin).count()
-                self.total_posts.setText(str(total_posts))
-
-                # Posts today
-                today = datetime.datetime.now().date()
-                posts_today = session.query(Pin).filter(Pin.created_at >= today).count()
-                self.posts_today.setText(str(posts_today))
-
-                # Pending posts
-                pending_posts = (
-                    session.query(Pin).filter(Pin.status == "pending").count()
+            total_posts, posts_today, pending_posts = self.get_post_counts()
+            self.total_posts.setText("%d" % total_posts)
+            self.posts_today.setText("%d" % posts_today)
+            self.pending_posts.setText("%d" % pending_posts)
+
+            # Fetch Pinterest (if connected) and WordPress stats off the GUI thread
+            pinterest_connected = bool(
+                self.parent.config.get("pinterest", {}).get("access_token")
+            )
+            if pinterest_connected and self.pinterest_group is None:
+                self._build_pinterest_group()
+            if self.pinterest_group is not None:
+                self.pinterest_group.setVisible(pinterest_connected)
+            if not self._fetching_stats:
+                self._fetching_stats = True
+                worker = StatsWorker(
+                    self.fetch_pinterest_stats if pinterest_connected else None,
+                    self.fetch_wordpress_stats,
                 )
-                self.pending_posts.setText(str(pending_posts))
+                worker.signals.finished.connect(self.on_remote_stats)
+                QThreadPool.globalInstance().start(worker)
+
+        except Exception as e:
+            logger.error(f"Error updating dashboard stats: {e}")
+        finally:
+            self.setUpdatesEnabled(True)
 
+    def on_remote_stats(self, pinterest_stats: dict, wordpress_stats: dict):
+        """Show Pinterest and WordPress stats fetched by StatsWorker"""
+        self._fetching_stats = False
+        self.setUpdatesEnabled(False)
+        try:
             # Update Pinterest statistics if connected
-            if self.parent.config.get("pinterest", {}).get("access_token"):
-                self.pinterest_group.setVisible(True)
-                # Fetch Pinterest stats
-                pinterest_stats = self.fetch_pinterest_stats()
-                self.total_pins.setText(str(pinterest_stats.get("total_pins", 0)))
-                self.pins_today.setText(str(pinterest_stats.get("pins_today", 0)))
-                self.total_saves.setText(str(pinterest_stats.get("total_saves", 0)))
-                self.total_clicks.setText(str(pinterest_stats.get("total_clicks", 0)))
-            else:
-                self.pinterest_group.setVisible(False)
+            if pinterest_stats:
+                self.total_pins.setText("%d" % pinterest_stats.get("total_pins", 0))
+                self.pins_today.setText("%d" % pinterest_stats.get("pins_today", 0))
+                self.total_saves.setText("%d" % pinterest_stats.get("total_saves", 0))
+                self.total_clicks.setText("%d" % pinterest_stats.get("total_clicks", 0))
 
             # Update WordPress statistics
-            wordpress_stats = self.fetch_wordpress_stats()
-            self.wp_total_posts.setText(str(wordpress_stats.get("total_posts", 0)))
-            self.wp_posts_today.setText(str(wordpress_stats.get("posts_today", 0)))
-            self.wp_total_views.setText(str(wordpress_stats.get("total_views", 0)))
-
-        except Exception as e:
-            logger.error(f"Error updating dashboard stats: {e}")
+            self.wp_total_posts.setText("%d" % wordpress_stats.get("total_posts", 0))
+            self.wp_posts_today.setText("%d" % wordpress_stats.get("posts_today", 0))
+            self.wp_total_views.setText("%d" % wordpress_stats.get("total_views", 0))
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def get_post_counts(self):
+        """Return (total, today, pending) pin counts, cached for _STATS_TTL"""
+        now = time.monotonic()
+        today = datetime.date.today()
+        if today != self._today:
+            # Same bound value for every refresh during the day
+            self._today = today
+            self._today_start = datetime.datetime.combine(today, datetime.time.min)
+        data = _stats_cache["data"]
+        if data is None or data[0] != today or now - _stats_cache["ts"] >= _STATS_TTL:
+            # Total, today and pending counts in a single table scan
+            with self.parent.db.get_session() as session:
+                total_posts, posts_today, pending_posts = session.query(
+                    func.count(Pin.id),
+                    func.sum(case((Pin.created_at >= self._today_start, 1), else_=0)),
+                    func.sum(case((Pin.status == "pending", 1), else_=0)),
+                ).one()
+
+            # SUM over an empty table is NULL
+            data = (today, total_posts, posts_today or 0, pending_posts or 0)
+            _stats_cache["ts"] = now
+            _stats_cache["data"] = data
+        return data[1:]
 
     def fetch_pinterest_stats(self):
         """Fetch Pinterest statistics"""
@@ -1,15 +1,32 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QPlainTextEdit,
+    QPushButton,
+    QHBoxLayout,
+)
+from PyQt5.QtCore import Qt, QTimer
 import logging
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
+# Delay used to coalesce bursts of log messages into one append
+LOG_FLUSH_INTERVAL_MS = 50
+
+# Oldest lines are dropped once the view holds this many
+MAX_LOG_LINES = 5000
+
 
 class LogTab(QWidget):
     """Log tab for viewing application logs"""
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._pending = deque()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_logs)
         self.init_ui()
 
     def init_ui(self):
@@ -17,8 +34,10 @@ class LogTab(QWidget):
         layout = QVBoxLayout()
 
         # Log view
-        self.log_view = QTextEdit()
+        self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
+        self.log_view.setUndoRedoEnabled(False)
+        self.log_view.document().setMaximumBlockCount(MAX_LOG_LINES)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -38,11 +57,22 @@ class LogTab(QWidget):
         self.setLayout(layout)
 
     def add_log(self, message: str):
-        """Add a log message to the view"""
-        self.log_view.append(message)
+        """Queue a log message for the next batched append"""
+        self._pending.append(message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(LOG_FLUSH_INTERVAL_MS)
+
+    def _flush_logs(self):
+        """Append all queued log messages in one call"""
+        if not self._pending:
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+        self.log_view.appendPlainText(text)
 
     def clear_logs(self):
         """Clear all logs"""
+        self._pending.clear()
         self.log_view.clear()
 
     def export_logs(self):
@@ -54,8 +84,13 @@ class LogTab(QWidget):
                 self, "Export Logs", "", "Text Files (*.txt);;All Files (*)"
             )
             if filename:
+                self._flush_logs()
+                # Write block by block instead of copying the whole document
                 with open(filename, "w") as f:
-                    f.write(self.log_view.toPlainText())
+                    block = self.log_view.document().firstBlock()
+                    while block.isValid():
+                        f.write(block.text() + "\n")
+                        block = block.next()
                 logger.info(f"Logs exported to {filename}")
         except Exception as e:
             logger.error(f"Error exporting logs: {e}")
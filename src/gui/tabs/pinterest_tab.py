@@ -14,16 +14,27 @@ from PyQt5.QtWidgets import (
     QGroupBox,
     QHeaderView,
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QUrl, QTimer, QCoreApplication
+from PyQt5.QtGui import QBrush
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 import json
-import os
+from ._config_cache import ConfigCache
 import logging
-import requests
+import time
 from typing import Dict, List, Optional
 import datetime
 
 logger = logging.getLogger(__name__)
 
+PINTEREST_API_HOST = "api.pinterest.com"
+PINTEREST_API_URL = f"https://{PINTEREST_API_HOST}/v5"
+# Minimum seconds between connection pre-warms while the token is typed
+PREWARM_INTERVAL = 30
+PINTEREST_TIMEOUT_MS = 30000
+
+# Account edits within this window are written to disk once
+SAVE_DEBOUNCE_MS = 500
+
 
 class PinterestTab(QWidget):
     """Tab for managing Pinterest accounts"""
@@ -31,13 +42,29 @@ class PinterestTab(QWidget):
     # Signal for account updates
     accounts_updated = pyqtSignal()
 
+    # Status column text colors
+    CONNECTED_BRUSH = QBrush(Qt.green)
+    DISCONNECTED_BRUSH = QBrush(Qt.red)
+
     def __init__(self, parent=None):
         """Initialize the Pinterest tab"""
         super().__init__(parent)
         self.parent_window = parent
         self.accounts = []
+        self._token_index = set()
+        self._last_prewarm = 0.0
         self.current_page = 0
         self.page_size = 10  # Number of accounts to show per page
+
+        # Debounced config writes, flushed on exit if still pending
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._flush_config)
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.flush_pending_save)
+
         self.init_ui()
         self.load_accounts()
 
@@ -45,6 +72,9 @@ class PinterestTab(QWidget):
         """Initialize the UI components"""
         layout = QVBoxLayout()
 
+        # Shared manager for the asynchronous connection test
+        self._nam = QNetworkAccessManager(self)
+
         # Form for adding new accounts
         form_group = QGroupBox("Add New Pinterest Account")
         form_layout = QFormLayout()
@@ -52,6 +82,7 @@ class PinterestTab(QWidget):
         # Access Token input
         self.token_input = QLineEdit()
         self.token_input.setPlaceholderText("Enter your Pinterest access token")
+        self.token_input.textEdited.connect(self._prewarm_connection)
         form_layout.addRow("Access Token:", self.token_input)
 
         # Board selection
@@ -107,6 +138,7 @@ class PinterestTab(QWidget):
             ["Access Token", "Board", "Interval", "Max Pins", "Status", "Actions"]
         )
         self.accounts_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self._build_table_rows()
         table_layout.addWidget(self.accounts_table)
 
         table_group.setLayout(table_layout)
@@ -117,14 +149,22 @@ class PinterestTab(QWidget):
     def load_accounts(self):
         """Load Pinterest accounts from config"""
         try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), "config.json"
-            )
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                    self.accounts = config.get("pinterest", {}).get("accounts", [])
-                    self.update_table()
+            if ConfigCache.exists():
+                pinterest = ConfigCache.get().get("pinterest", {})
+                accounts = pinterest.get("accounts", [])
+                self.accounts = []
+                self._token_index = set()
+                for index, account in enumerate(accounts):
+                    # Skip malformed entries instead of failing the whole load
+                    token = isinstance(account, dict) and account.get("access_token")
+                    if not token:
+                        logger.warning(f"Skipping invalid Pinterest account #{index}")
+                        continue
+                    # Copy so the display-only mask stays out of the shared cache
+                    account = dict(account, _masked_token=self._mask_token(token))
+                    self.accounts.append(account)
+                    self._token_index.add(token)
+                self.update_table()
         except Exception as e:
             logger.error(f"Error loading Pinterest accounts: {e}")
             QMessageBox.critical(
@@ -134,25 +174,35 @@ class PinterestTab(QWidget):
                 "Please check the logs for more details.",
             )
 
+    @staticmethod
+    def _mask_token(token: str) -> str:
+        """Show only first 10 characters of token for security"""
+        return token[:10] + "..." if len(token) > 10 else token
+
     def save_accounts(self):
-        """Save Pinterest accounts to config"""
+        """Schedule a debounced save of Pinterest accounts to config"""
+        if ConfigCache.exists():
+            self._save_timer.start()
+
+    def flush_pending_save(self):
+        """Write a scheduled save immediately"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_config()
+
+    def _flush_config(self):
+        """Write Pinterest accounts into config.json atomically"""
         try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), "config.json"
-            )
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-
-                if "pinterest" not in config:
-                    config["pinterest"] = {}
-                config["pinterest"]["accounts"] = self.accounts
-
-                with open(config_path, "w") as f:
-                    json.dump(config, f, indent=4)
-
-                # Emit signal for account updates
-                self.accounts_updated.emit()
+            pinterest = dict(ConfigCache.get().get("pinterest", {}))
+            # The masked token is display-only and not persisted
+            pinterest["accounts"] = [
+                {k: v for k, v in account.items() if k != "_masked_token"}
+                for account in self.accounts
+            ]
+            ConfigCache.update({"pinterest": pinterest})
+
+            # Emit signal for account updates
+            self.accounts_updated.emit()
         except Exception as e:
             logger.error(f"Error saving Pinterest accounts: {e}")
             QMessageBox.critical(
@@ -162,10 +212,27 @@ class PinterestTab(QWidget):
                 "Please check the logs for more details.",
             )
 
+    def _build_table_rows(self):
+        """Create one page of reusable table items and Remove buttons"""
+        self.accounts_table.setRowCount(self.page_size)
+        self._cells = []
+        self._remove_buttons = []
+        for i in range(self.page_size):
+            row = [QTableWidgetItem() for _ in range(5)]
+            for column, item in enumerate(row):
+                self.accounts_table.setItem(i, column, item)
+            self._cells.append(row)
+            remove_btn = QPushButton("Remove")
+            remove_btn.clicked.connect(self._on_remove_clicked)
+            self.accounts_table.setCellWidget(i, 5, remove_btn)
+            self._remove_buttons.append(remove_btn)
+            self.accounts_table.setRowHidden(i, True)
+
     def update_table(self):
         """Update the accounts table with pagination"""
         if not self.accounts:
-            self.accounts_table.setRowCount(0)
+            for i in range(self.page_size):
+                self.accounts_table.setRowHidden(i, True)
             return
 
         # Calculate pagination
@@ -182,39 +249,41 @@ class PinterestTab(QWidget):
         end_idx = min(start_idx + self.page_size, len(self.accounts))
         current_accounts = self.accounts[start_idx:end_idx]
 
-        # Update table
-        self.accounts_table.setRowCount(len(current_accounts))
-        for i, account in enumerate(current_accounts):
-            # Show only first 10 characters of token for security
-            token = (
-                account["access_token"][:10] + "..."
-                if len(account["access_token"]) > 10
-                else account["access_token"]
-            )
-            self.accounts_table.setItem(i, 0, QTableWidgetItem(token))
-            self.accounts_table.setItem(i, 1, QTableWidgetItem(account["board"]))
-            self.accounts_table.setItem(
-                i, 2, QTableWidgetItem(str(account["pin_interval"]))
-            )
-            self.accounts_table.setItem(
-                i, 3, QTableWidgetItem(str(account["max_pins_per_day"]))
-            )
+        # Update the existing rows in place and hide the unused ones
+        table = self.accounts_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            for i in range(self.page_size):
+                if i >= len(current_accounts):
+                    table.setRowHidden(i, True)
+                    continue
+                account = current_accounts[i]
+
+                cells = self._cells[i]
+                cells[0].setText(account["_masked_token"])
+                cells[1].setText(account["board"])
+                cells[2].setText("%d" % account["pin_interval"])
+                cells[3].setText("%d" % account["max_pins_per_day"])
+
+                # Status
+                if account.get("is_connected", False):
+                    cells[4].setText("Connected")
+                    cells[4].setForeground(self.CONNECTED_BRUSH)
+                else:
+                    cells[4].setText("Disconnected")
+                    cells[4].setForeground(self.DISCONNECTED_BRUSH)
 
-            # Status
-            status_item = QTableWidgetItem(
-                "Connected" if account.get("is_connected", False) else "Disconnected"
-            )
-            status_item.setForeground(
-                Qt.green if account.get("is_connected", False) else Qt.red
-            )
-            self.accounts_table.setItem(i, 4, status_item)
+                table.setRowHidden(i, False)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
-            # Remove button
-            remove_btn = QPushButton("Remove")
-            remove_btn.clicked.connect(
-                lambda checked, row=start_idx + i: self.remove_account(row)
-            )
-            self.accounts_table.setCellWidget(i, 5, remove_btn)
+    def _on_remove_clicked(self):
+        """Remove the account on the row of the clicked Remove button"""
+        row = self.accounts_table.indexAt(self.sender().pos()).row()
+        if row >= 0:
+            self.remove_account(self.current_page * self.page_size + row)
 
     def prev_page(self):
         """Go to previous page"""
@@ -228,90 +297,127 @@ class PinterestTab(QWidget):
             self.current_page += 1
             self.update_table()
 
-    def test_connection(self):
-        """Test connection to Pinterest API"""
+    def _prewarm_connection(self):
+        """Open the TLS connection to the API while the token is entered"""
+        now = time.monotonic()
+        if now - self._last_prewarm >= PREWARM_INTERVAL:
+            self._last_prewarm = now
+            self._nam.connectToHostEncrypted(PINTEREST_API_HOST)
+
+    def _pinterest_get(self, path: str, token: str) -> QNetworkReply:
+        """Start an authenticated GET request against the Pinterest API"""
+        request = QNetworkRequest(QUrl(f"{PINTEREST_API_URL}/{path}"))
+        request.setRawHeader(b"Authorization", f"Bearer {token}".encode())
+        request.setTransferTimeout(PINTEREST_TIMEOUT_MS)
+        return self._nam.get(request)
+
+    def test_connection(self, on_success=None):
+        """Test connection to Pinterest API without blocking the UI
+
+        on_success, if given, is called once the account and its boards
+        have been fetched successfully.
+        """
         token = self.token_input.text().strip()
 
         if not token:
             QMessageBox.warning(self, "Error", "Please enter an access token")
-            return False
+            return
 
         # Show progress dialog
-        progress = QMessageBox(self)
-        progress.setWindowTitle("Testing Connection")
-        progress.setText("Testing Pinterest connection...")
-        progress.setStandardButtons(QMessageBox.NoButton)
-        progress.show()
+        self._test_progress = QMessageBox(self)
+        self._test_progress.setWindowTitle("Testing Connection")
+        self._test_progress.setText("Testing Pinterest connection...")
+        self._test_progress.setStandardButtons(QMessageBox.NoButton)
+        self._test_progress.show()
+
+        # Test Pinterest API connection; the boards request is chained on reply
+        reply = self._pinterest_get("user_account", token)
+        reply.finished.connect(
+            lambda: self._on_user_account_reply(reply, token, on_success)
+        )
 
+    def _on_user_account_reply(self, reply, token, on_success):
+        """Handle the user account response and request the boards"""
         try:
-            # Test Pinterest API connection
-            response = requests.get(
-                "https://api.pinterest.com/v5/user_account",
-                headers={"Authorization": f"Bearer {token}"},
-                timeout=30,
-            )
-
-            if response.status_code == 200:
-                # Get user info
-                user_info = response.json()
-
-                # Get boards
-                boards_response = requests.get(
-                    "https://api.pinterest.com/v5/boards",
-                    headers={"Authorization": f"Bearer {token}"},
-                    timeout=30,
+            status, body = self._read_reply(reply)
+            if status != 200:
+                self._test_progress.close()
+                QMessageBox.warning(
+                    self,
+                    "Error",
+                    f"Connection failed with status code: {status}\n"
+                    f"Response: {body[:200]}...",
                 )
+                return
 
-                if boards_response.status_code == 200:
-                    boards = boards_response.json().get("items", [])
-
-                    # Update board selection
-                    self.board_input.clear()
-                    self.board_input.addItems([board["name"] for board in boards])
-                    self.board_input.setEnabled(True)
-
-                    # Close progress dialog
-                    progress.close()
+            # Get user info
+            user_info = json.loads(body)
 
-                    # Show success message
-                    QMessageBox.information(
-                        self,
-                        "Success",
-                        f"Connection successful!\n\n"
-                        f"Username: {user_info.get('username', 'Unknown')}\n"
-                        f"Boards Found: {len(boards)}",
-                    )
+            # Get boards
+            boards_reply = self._pinterest_get("boards", token)
+            boards_reply.finished.connect(
+                lambda: self._on_boards_reply(boards_reply, user_info, on_success)
+            )
+        except Exception as e:
+            self._on_connection_error(e)
 
-                    return True
-                else:
-                    progress.close()
-                    QMessageBox.warning(
-                        self,
-                        "Error",
-                        f"Failed to get boards: {boards_response.status_code}\n"
-                        f"Response: {boards_response.text[:200]}...",
-                    )
-                    return False
-            else:
-                progress.close()
+    def _on_boards_reply(self, reply, user_info, on_success):
+        """Populate the board selection from the boards response"""
+        try:
+            status, body = self._read_reply(reply)
+            self._test_progress.close()
+            if status != 200:
                 QMessageBox.warning(
                     self,
                     "Error",
-                    f"Connection failed with status code: {response.status_code}\n"
-                    f"Response: {response.text[:200]}...",
+                    f"Failed to get boards: {status}\nResponse: {body[:200]}...",
                 )
-                return False
+                return
 
-        except Exception as e:
-            progress.close()
-            logger.error(f"Error testing Pinterest connection: {e}")
-            QMessageBox.critical(
+            boards = json.loads(body).get("items", [])
+
+            # Update board selection
+            self.board_input.clear()
+            self.board_input.addItems([board["name"] for board in boards])
+            self.board_input.setEnabled(True)
+
+            if on_success:
+                on_success()
+                return
+
+            # Show success message
+            QMessageBox.information(
                 self,
-                "Error",
-                f"Failed to test connection: {str(e)}\n\n"
-                "Please check the logs for more details.",
+                "Success",
+                f"Connection successful!\n\n"
+                f"Username: {user_info.get('username', 'Unknown')}\n"
+                f"Boards Found: {len(boards)}",
             )
-            return False
+        except Exception as e:
+            self._on_connection_error(e)
+
+    @staticmethod
+    def _read_reply(reply):
+        """Return (HTTP status, body text) and release the reply"""
+        try:
+            status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+            if status is None:
+                # No HTTP response at all (DNS failure, timeout, ...)
+                raise ConnectionError(reply.errorString())
+            return status, bytes(reply.readAll()).decode("utf-8", "replace")
+        finally:
+            reply.deleteLater()
+
+    def _on_connection_error(self, error):
+        """Report a failed connection test"""
+        self._test_progress.close()
+        logger.error(f"Error testing Pinterest connection: {error}")
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to test connection: {str(error)}\n\n"
+            "Please check the logs for more details.",
+        )
 
     def add_account(self):
         """Add a new Pinterest account"""
@@ -325,23 +431,20 @@ class PinterestTab(QWidget):
             return
 
         # Check if account already exists
-        if any(account["access_token"] == token for account in self.accounts):
+        if token in self._token_index:
             QMessageBox.warning(self, "Error", "This account is already added")
             return
 
-        # Show progress dialog
-        progress = QMessageBox(self)
-        progress.setWindowTitle("Adding Account")
-        progress.setText("Adding Pinterest account...")
-        progress.setStandardButtons(QMessageBox.NoButton)
-        progress.show()
+        # Test connection before adding
+        self.test_connection(
+            on_success=lambda: self._save_new_account(
+                token, board, pin_interval, max_pins
+            )
+        )
 
+    def _save_new_account(self, token, board, pin_interval, max_pins):
+        """Store an account whose connection test succeeded"""
         try:
-            # Test connection before adding
-            if not self.test_connection():
-                progress.close()
-                return
-
             # Add new account
             new_account = {
                 "access_token": token,
@@ -350,9 +453,11 @@ class PinterestTab(QWidget):
                 "max_pins_per_day": max_pins,
                 "is_connected": True,
                 "last_checked": datetime.datetime.now().isoformat(),
+                "_masked_token": self._mask_token(token),
             }
 
             self.accounts.append(new_account)
+            self._token_index.add(token)
             self.save_accounts()
             self.update_table()
 
@@ -361,11 +466,9 @@ class PinterestTab(QWidget):
             self.board_input.clear()
             self.board_input.setEnabled(False)
 
-            progress.close()
             QMessageBox.information(self, "Success", "Account added successfully!")
 
         except Exception as e:
-            progress.close()
             logger.error(f"Error adding Pinterest account: {e}")
             QMessageBox.critical(
                 self,
@@ -388,6 +491,7 @@ class PinterestTab(QWidget):
         )
 
         if reply == QMessageBox.Yes:
+            self._token_index.discard(self.accounts[row]["access_token"])
             self.accounts.pop(row)
             self.save_accounts()
             self.update_table()
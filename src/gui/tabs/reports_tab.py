@@ -2,24 +2,175 @@ from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
     QMessageBox,
     QComboBox,
     QGroupBox,
     QHeaderView,
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-import json
-import os
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QBrush
 import logging
 import datetime
-from typing import Dict, List, Optional
+import os
+import sqlite3
+import threading
+from enum import IntEnum
+from typing import Dict, Iterable, List, NamedTuple
+from ._button_delegate import ButtonDelegate
+from ._config_cache import CONFIG_PATH, ConfigCache
 
 logger = logging.getLogger(__name__)
 
+REPORTS_DB_PATH = os.path.join(os.path.dirname(CONFIG_PATH), "reports.db")
+
+# Rows fetched from the database each time the view scrolls near the end
+REPORTS_PAGE_SIZE = 100
+
+# Days covered by each date range choice; missing entries are unbounded
+DATE_RANGE_DAYS = {"Last 7 Days": 7, "Last 30 Days": 30, "Last 90 Days": 90}
+
+
+class ReportStatus(IntEnum):
+    """Report outcome, used to index ReportsModel.STATUS_BRUSHES"""
+
+    OK = 0
+    FAIL = 1
+
+    @classmethod
+    def of(cls, report: "Report") -> "ReportStatus":
+        """Classify a report by its stored status string"""
+        return cls.OK if report.status == "Success" else cls.FAIL
+
+
+class Report(NamedTuple):
+    """A single report row, in table column order"""
+
+    date: str
+    type: str
+    status: str
+    details: str
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Report":
+        """Build a report from a stored dict, defaulting missing fields"""
+        return cls._make(str(data.get(field, "")) for field in cls._fields)
+
+
+class ReportsRepo:
+    """SQLite storage for reports, indexed by date"""
+
+    def __init__(self, path: str = REPORTS_DB_PATH):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS reports"
+                "(date TEXT, type TEXT, status TEXT, details TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_date ON reports(date)")
+
+    def is_empty(self) -> bool:
+        """Return True if no reports are stored"""
+        with self._lock:
+            return (
+                self._conn.execute("SELECT 1 FROM reports LIMIT 1").fetchone() is None
+            )
+
+    def add(self, report: Report) -> None:
+        """Insert a single report"""
+        self.add_many([report])
+
+    def add_many(self, reports: Iterable[Report]) -> None:
+        """Insert several reports in one transaction"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO reports(date, type, status, details) VALUES (?, ?, ?, ?)",
+                reports,
+            )
+
+    def query(self, start: str, end: str, limit: int, offset: int) -> List[Report]:
+        """Return one page of reports between two ISO timestamps, newest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, type, status, details FROM reports "
+                "WHERE date BETWEEN ? AND ? ORDER BY date DESC LIMIT ? OFFSET ?",
+                (start, end, limit, offset),
+            ).fetchall()
+        return list(map(Report._make, rows))
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class ReportsModel(QAbstractTableModel):
+    """Table model reading cells straight from Report tuples"""
+
+    HEADERS = ["Date", "Type", "Status", "Details", "Actions"]
+    SUCCESS_BRUSH = QBrush(Qt.green)
+    FAILURE_BRUSH = QBrush(Qt.red)
+    STATUS_BRUSHES = (SUCCESS_BRUSH, FAILURE_BRUSH)  # Indexed by ReportStatus
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._statuses = []  # ReportStatus per row, classified on fetch
+        self._fetch = None
+        self._has_more = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.DisplayRole and col < len(Report._fields):
+            return self._rows[index.row()][col]
+        if role == Qt.ForegroundRole and col == 2:
+            return self.STATUS_BRUSHES[self._statuses[index.row()]]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def setSource(self, fetch):
+        """Show reports from fetch(limit, offset), loading pages on demand"""
+        self.beginResetModel()
+        self._fetch = fetch
+        self._rows = fetch(REPORTS_PAGE_SIZE, 0)
+        self._statuses = list(map(ReportStatus.of, self._rows))
+        self._has_more = len(self._rows) == REPORTS_PAGE_SIZE
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more:
+            return
+        page = self._fetch(REPORTS_PAGE_SIZE, len(self._rows))
+        self._has_more = len(page) == REPORTS_PAGE_SIZE
+        if page:
+            row = len(self._rows)
+            self.beginInsertRows(QModelIndex(), row, row + len(page) - 1)
+            self._rows.extend(page)
+            self._statuses.extend(map(ReportStatus.of, page))
+            self.endInsertRows()
+
+    def report(self, row):
+        """Return the report shown at a row"""
+        return self._rows[row]
+
 
 class ReportsTab(QWidget):
     """Tab for viewing application reports"""
@@ -28,9 +179,7 @@ class ReportsTab(QWidget):
         """Initialize the reports tab"""
         super().__init__(parent)
         self.parent_window = parent
-        self.reports = []
-        self.current_page = 0
-        self.page_size = 10  # Number of reports to show per page
+        self.repo = None
         self.init_ui()
         self.load_reports()
 
@@ -74,23 +223,18 @@ class ReportsTab(QWidget):
         table_group = QGroupBox("Report Results")
         table_layout = QVBoxLayout()
 
-        # Pagination controls
-        pagination_layout = QHBoxLayout()
-        self.prev_button = QPushButton("Previous")
-        self.prev_button.clicked.connect(self.prev_page)
-        self.next_button = QPushButton("Next")
-        self.next_button.clicked.connect(self.next_page)
-        self.page_label = QLabel("Page 1")
-        pagination_layout.addWidget(self.prev_button)
-        pagination_layout.addWidget(self.page_label)
-        pagination_layout.addWidget(self.next_button)
-        table_layout.addLayout(pagination_layout)
-
-        self.report_table = QTableWidget()
-        self.report_table.setColumnCount(5)
-        self.report_table.setHorizontalHeaderLabels(
-            ["Date", "Type", "Status", "Details", "Actions"]
-        )
+        self.report_model = ReportsModel(self)
+        self.report_table = QTableView()
+        self.report_table.setModel(self.report_model)
+        self.report_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.view_delegate = ButtonDelegate("View", self.report_table)
+        self.view_delegate.clicked.connect(self.view_report)
+        self.report_table.setItemDelegateForColumn(4, self.view_delegate)
+        # All reports live in one scrolling view; the model pulls further
+        # pages from the database as the user scrolls, and fixed sizing
+        # avoids measuring every row
+        self.report_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.report_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.report_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         table_layout.addWidget(self.report_table)
 
@@ -100,16 +244,15 @@ class ReportsTab(QWidget):
         self.setLayout(layout)
 
     def load_reports(self):
-        """Load reports from config"""
+        """Open the reports database and show the selected date range"""
         try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), "config.json"
-            )
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                    self.reports = config.get("reports", [])
-                    self.update_table()
+            self.repo = ReportsRepo()
+            if self.repo.is_empty() and ConfigCache.exists():
+                # One-time import of reports stored by older versions
+                legacy = ConfigCache.get().get("reports", [])
+                if legacy:
+                    self.repo.add_many(map(Report.from_dict, legacy))
+            self.update_table()
         except Exception as e:
             logger.error(f"Error loading reports: {e}")
             QMessageBox.critical(
@@ -119,90 +262,22 @@ class ReportsTab(QWidget):
                 "Please check the logs for more details.",
             )
 
-    def save_reports(self):
-        """Save reports to config"""
-        try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), "config.json"
-            )
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-
-                config["reports"] = self.reports
-
-                with open(config_path, "w") as f:
-                    json.dump(config, f, indent=4)
-
-        except Exception as e:
-            logger.error(f"Error saving reports: {e}")
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to save reports: {str(e)}\n\n"
-                "Please check the logs for more details.",
-            )
+    def _date_bounds(self):
+        """Return ISO start/end timestamps for the selected date range"""
+        now = datetime.datetime.now()
+        days = DATE_RANGE_DAYS.get(self.date_range.currentText())
+        start = (now - datetime.timedelta(days=days)).isoformat() if days else ""
+        return start, now.isoformat()
 
     def update_table(self):
-        """Update the reports table with pagination"""
-        if not self.reports:
-            self.report_table.setRowCount(0)
+        """Show reports in the selected date range, newest first"""
+        if self.repo is None:
             return
-
-        # Calculate pagination
-        total_pages = (len(self.reports) + self.page_size - 1) // self.page_size
-        self.current_page = min(self.current_page, total_pages - 1)
-
-        # Update pagination controls
-        self.page_label.setText(f"Page {self.current_page + 1} of {total_pages}")
-        self.prev_button.setEnabled(self.current_page > 0)
-        self.next_button.setEnabled(self.current_page < total_pages - 1)
-
-        # Get current page data
-        start_idx = self.current_page * self.page_size
-        end_idx = min(start_idx + self.page_size, len(self.reports))
-        current_reports = self.reports[start_idx:end_idx]
-
-        # Update table
-        self.report_table.setRowCount(len(current_reports))
-        for i, report in enumerate(current_reports):
-            # Date
-            date_item = QTableWidgetItem(report.get("date", ""))
-            self.report_table.setItem(i, 0, date_item)
-
-            # Type
-            type_item = QTableWidgetItem(report.get("type", ""))
-            self.report_table.setItem(i, 1, type_item)
-
-            # Status
-            status_item = QTableWidgetItem(report.get("status", ""))
-            status_item.setForeground(
-                Qt.green if report.get("status") == "Success" else Qt.red
-            )
-            self.report_table.setItem(i, 2, status_item)
-
-            # Details
-            details_item = QTableWidgetItem(report.get("details", ""))
-            self.report_table.setItem(i, 3, details_item)
-
-            # View button
-            view_btn = QPushButton("View")
-            view_btn.clicked.connect(
-                lambda checked, row=start_idx + i: self.view_report(row)
-            )
-            self.report_table.setCellWidget(i, 4, view_btn)
-
-    def prev_page(self):
-        """Go to previous page"""
-        if self.current_page > 0:
-            self.current_page -= 1
-            self.update_table()
-
-    def next_page(self):
-        """Go to next page"""
-        if (self.current_page + 1) * self.page_size < len(self.reports):
-            self.current_page += 1
-            self.update_table()
+        start, end = self._date_bounds()
+        repo = self.repo
+        self.report_model.setSource(
+            lambda limit, offset: repo.query(start, end, limit, offset)
+        )
 
     def generate_report(self):
         """Generate a new report"""
@@ -218,16 +293,14 @@ class ReportsTab(QWidget):
 
         try:
             # Generate report data
-            report_data = {
-                "date": datetime.datetime.now().isoformat(),
-                "type": report_type,
-                "status": "Success",
-                "details": f"Report generated for {date_range}",
-            }
-
-            # Add to reports list
-            self.reports.append(report_data)
-            self.save_reports()
+            report_data = Report(
+                date=datetime.datetime.now().isoformat(),
+                type=report_type,
+                status="Success",
+                details=f"Report generated for {date_range}",
+            )
+
+            self.repo.add(report_data)
             self.update_table()
 
             progress.close()
@@ -245,22 +318,21 @@ class ReportsTab(QWidget):
 
     def view_report(self, row):
         """View a specific report"""
-        if row < 0 or row >= len(self.reports):
+        if row < 0 or row >= self.report_model.rowCount():
             return
 
-        report = self.reports[row]
+        report = self.report_model.report(row)
 
         # Show report details
         QMessageBox.information(
             self,
-            f"Report Details - {report['type']}",
-            f"Date: {report['date']}\n"
-            f"Type: {report['type']}\n"
-            f"Status: {report['status']}\n"
-            f"Details: {report['details']}",
+            f"Report Details - {report.type}",
+            f"Date: {report.date}\n"
+            f"Type: {report.type}\n"
+            f"Status: {report.status}\n"
+            f"Details: {report.details}",
         )
 
     def update_report(self):
         """Update the report based on selected type and date range"""
-        # Implementation will be added later
-        pass
+        self.update_table()
@@ -1,7 +1,6 @@
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
-    QHBoxLayout,
     QLabel,
     QLineEdit,
     QPushButton,
@@ -13,13 +12,56 @@ from PyQt5.QtWidgets import (
     QCheckBox,
     QTabWidget,
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-import json
-import os
+from PyQt5.QtCore import pyqtSignal, QObject, QRunnable, QThreadPool, QSettings
 import logging
+from ._config_cache import ConfigCache
 
 logger = logging.getLogger(__name__)
 
+SETTINGS_ORGANIZATION = "tikgen"
+SETTINGS_APPLICATION = "tikgen"
+
+# Set once the "settings" section of config.json has been copied over
+_MIGRATED_KEY = "migrated_from_config"
+
+
+def _settings_store() -> QSettings:
+    """Return the native per-user settings store"""
+    return QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+
+
+def _store_settings(store: QSettings, settings: dict, prefix: str = "") -> None:
+    """Write a nested settings dict as one "group/key" entry per value"""
+    for key, value in settings.items():
+        if isinstance(value, dict):
+            _store_settings(store, value, f"{prefix}{key}/")
+        else:
+            store.setValue(prefix + key, value)
+
+
+class _ConfigSignals(QObject):
+    """Signal bridge for _ConfigTask (QRunnable cannot emit signals itself)"""
+
+    finished = pyqtSignal(object)  # Return value of the task function
+    failed = pyqtSignal(str)  # Error message
+
+
+class _ConfigTask(QRunnable):
+    """Runs a config.json read or write on a thread pool thread"""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = _ConfigSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
 
 class SettingsTab(QWidget):
     """Settings tab for managing application settings"""
@@ -27,11 +69,20 @@ class SettingsTab(QWidget):
     # Signal for settings updates
     settings_updated = pyqtSignal()
 
+    # Descriptions shown under the model combo box
+    _MODEL_DESCRIPTIONS = {
+        "gpt-3.5-turbo": "Fast and efficient model for general text generation",
+        "gpt-4": "Most capable model for complex tasks and high-quality content",
+        "claude-3-opus": "Advanced model with strong reasoning capabilities",
+        "claude-3-sonnet": "Balanced model for most content generation tasks",
+        "claude-3-haiku": "Lightweight model for quick responses",
+        "google/gemini-2.5-pro-exp-03-25:free": "Google's latest Gemini model with advanced capabilities",
+    }
+
     def __init__(self, parent=None):
         """Initialize the settings tab"""
         super().__init__(parent)
         self.parent_window = parent
-        self.settings = {}
         self.init_ui()
         self.load_settings()
 
@@ -248,160 +299,144 @@ class SettingsTab(QWidget):
         layout.addWidget(tab_widget)
 
         # Save Button
-        save_button = QPushButton("Save Settings")
-        save_button.clicked.connect(self.save_settings)
-        layout.addWidget(save_button)
+        self.save_button = QPushButton("Save Settings")
+        self.save_button.clicked.connect(self.save_settings)
+        layout.addWidget(self.save_button)
 
         self.setLayout(layout)
 
     def load_settings(self):
-        """Load settings from config"""
+        """Load settings from the native settings store"""
+        store = _settings_store()
+        if not store.contains(_MIGRATED_KEY) and ConfigCache.exists():
+            # One-time import of settings saved in config.json by older versions
+            task = _ConfigTask(lambda: ConfigCache.get().get("settings", {}))
+            task.signals.finished.connect(self._migrate_settings)
+            task.signals.failed.connect(self._on_load_failed)
+            QThreadPool.globalInstance().start(task)
+            return
+        self._apply_settings(store)
+
+    def _migrate_settings(self, settings: dict):
+        """Copy settings read from config.json into the settings store"""
+        store = _settings_store()
+        _store_settings(store, settings)
+        store.setValue(_MIGRATED_KEY, True)
+        store.sync()
+        self._apply_settings(store)
+
+    def _on_load_failed(self, error: str):
+        """Report a failed settings load"""
+        logger.error(f"Error loading settings: {error}")
+        QMessageBox.warning(self, "Error", f"Failed to load settings: {error}")
+
+    def _apply_settings(self, store: QSettings):
+        """Populate the widgets from the settings store"""
+
+        def value(key, default):
+            # INI-backed stores return strings unless the type is given
+            return store.value(key, default, type=type(default))
+
         try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), "config.json"
+            # Update UI with loaded settings
+            self.openrouter_key.setText(value("openrouter_api_key", ""))
+            self.model_combo.setCurrentText(value("model", "gpt-3.5-turbo"))
+            self.article_length.setCurrentText(
+                value("article_length", "Medium (750-1000 words)")
+            )
+            self.image_style.setCurrentText(value("image_style", "Realistic"))
+            self.max_images.setValue(value("max_images_per_article", 3))
+            self.keywords_count.setValue(value("keywords_per_article", 5))
+            self.enable_automation.setChecked(value("automation/enabled", False))
+            self.content_schedule.setCurrentText(
+                value("automation/content_schedule", "Daily")
+            )
+            self.wordpress_schedule.setCurrentText(
+                value("automation/wordpress_schedule", "Daily")
             )
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                    self.settings = config.get("settings", {})
-
-                    # Update UI with loaded settings
-                    self.openrouter_key.setText(
-                        self.settings.get("openrouter_api_key", "")
-                    )
-                    self.model_combo.setCurrentText(
-                        self.settings.get("model", "gpt-3.5-turbo")
-                    )
-                    self.article_length.setCurrentText(
-                        self.settings.get("article_length", "Medium (750-1000 words)")
-                    )
-                    self.image_style.setCurrentText(
-                        self.settings.get("image_style", "Realistic")
-                    )
-                    self.max_images.setValue(
-                        self.settings.get("max_images_per_article", 3)
-                    )
-                    self.keywords_count.setValue(
-                        self.settings.get("keywords_per_article", 5)
-                    )
-                    self.enable_automation.setChecked(
-                        self.settings.get("automation", {}).get("enabled", False)
-                    )
-                    self.content_schedule.setCurrentText(
-                        self.settings.get("automation", {}).get(
-                            "content_schedule", "Daily"
-                        )
-                    )
-                    self.wordpress_schedule.setCurrentText(
-                        self.settings.get("automation", {}).get(
-                            "wordpress_schedule", "Daily"
-                        )
-                    )
-
-                    # Load image generation settings
-                    image_config = self.settings.get("image_generation", {})
-                    self.image_api.setCurrentText(
-                        image_config.get("provider", "Stable Diffusion API")
-                    )
-                    self.image_api_key.setText(image_config.get("api_key", ""))
-                    self.image_size.setCurrentText(
-                        image_config.get("size", "1024x1024")
-                    )
-
-                    # Load Pinterest settings
-                    pinterest_config = self.settings.get("pinterest", {})
-                    self.pinterest_access_token.setText(
-                        pinterest_config.get("access_token", "")
-                    )
-                    self.pinterest_app_id.setText(pinterest_config.get("app_id", ""))
-                    self.pinterest_app_secret.setText(
-                        pinterest_config.get("app_secret", "")
-                    )
-                    self.default_board.setText(
-                        pinterest_config.get("default_board", "")
-                    )
-                    self.pin_interval.setValue(pinterest_config.get("pin_interval", 4))
-                    self.max_pins_per_day.setValue(
-                        pinterest_config.get("max_pins_per_day", 10)
-                    )
-                    self.avoid_spam.setChecked(
-                        pinterest_config.get("avoid_spam", {}).get("enabled", True)
-                    )
+
+            # Load image generation settings
+            self.image_api.setCurrentText(
+                value("image_generation/provider", "Stable Diffusion API")
+            )
+            self.image_api_key.setText(value("image_generation/api_key", ""))
+            self.image_size.setCurrentText(value("image_generation/size", "1024x1024"))
+
+            # Load Pinterest settings
+            self.pinterest_access_token.setText(value("pinterest/access_token", ""))
+            self.pinterest_app_id.setText(value("pinterest/app_id", ""))
+            self.pinterest_app_secret.setText(value("pinterest/app_secret", ""))
+            self.default_board.setText(value("pinterest/default_board", ""))
+            self.pin_interval.setValue(value("pinterest/pin_interval", 4))
+            self.max_pins_per_day.setValue(value("pinterest/max_pins_per_day", 10))
+            self.avoid_spam.setChecked(value("pinterest/avoid_spam/enabled", True))
 
         except Exception as e:
-            logger.error(f"Error loading settings: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to load settings: {str(e)}")
+            self._on_load_failed(str(e))
 
     def save_settings(self):
-        """Save settings to config"""
+        """Save settings to the native settings store"""
         try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), "config.json"
-            )
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-
-                # Update settings
-                config["settings"] = {
-                    "openrouter_api_key": self.openrouter_key.text(),
-                    "model": self.model_combo.currentText(),
-                    "article_length": self.article_length.currentText(),
-                    "image_style": self.image_style.currentText(),
-                    "max_images_per_article": self.max_images.value(),
-                    "keywords_per_article": self.keywords_count.value(),
-                    "automation": {
-                        "enabled": self.enable_automation.isChecked(),
-                        "content_schedule": self.content_schedule.currentText(),
-                        "wordpress_schedule": self.wordpress_schedule.currentText(),
-                    },
-                    "image_generation": {
-                        "provider": self.image_api.currentText(),
-                        "api_key": self.image_api_key.text(),
-                        "style": self.image_style.currentText(),
-                        "size": self.image_size.currentText(),
-                    },
-                    "pinterest": {
-                        "access_token": self.pinterest_access_token.text(),
-                        "app_id": self.pinterest_app_id.text(),
-                        "app_secret": self.pinterest_app_secret.text(),
-                        "default_board": self.default_board.text(),
-                        "pin_interval": self.pin_interval.value(),
+            # Update settings
+            settings = {
+                "openrouter_api_key": self.openrouter_key.text(),
+                "model": self.model_combo.currentText(),
+                "article_length": self.article_length.currentText(),
+                "image_style": self.image_style.currentText(),
+                "max_images_per_article": self.max_images.value(),
+                "keywords_per_article": self.keywords_count.value(),
+                "automation": {
+                    "enabled": self.enable_automation.isChecked(),
+                    "content_schedule": self.content_schedule.currentText(),
+                    "wordpress_schedule": self.wordpress_schedule.currentText(),
+                },
+                "image_generation": {
+                    "provider": self.image_api.currentText(),
+                    "api_key": self.image_api_key.text(),
+                    "style": self.image_style.currentText(),
+                    "size": self.image_size.currentText(),
+                },
+                "pinterest": {
+                    "access_token": self.pinterest_access_token.text(),
+                    "app_id": self.pinterest_app_id.text(),
+                    "app_secret": self.pinterest_app_secret.text(),
+                    "default_board": self.default_board.text(),
+                    "pin_interval": self.pin_interval.value(),
+                    "max_pins_per_day": self.max_pins_per_day.value(),
+                    "avoid_spam": {
+                        "enabled": self.avoid_spam.isChecked(),
+                        "min_interval": 300,
                         "max_pins_per_day": self.max_pins_per_day.value(),
-                        "avoid_spam": {
-                            "enabled": self.avoid_spam.isChecked(),
-                            "min_interval": 300,
-                            "max_pins_per_day": self.max_pins_per_day.value(),
-                            "random_delay": True,
-                        },
+                        "random_delay": True,
                     },
-                }
+                },
+            }
 
-                with open(config_path, "w") as f:
-                    json.dump(config, f, indent=4)
+            store = _settings_store()
+            _store_settings(store, settings)
+            store.setValue(_MIGRATED_KEY, True)
+            store.sync()
+            if store.status() != QSettings.NoError:
+                raise OSError(f"could not write {store.fileName()}")
 
-                # Emit signal for settings updates
-                self.settings_updated.emit()
+            # Emit signal for settings updates
+            self.settings_updated.emit()
 
-                QMessageBox.information(self, "Success", "Settings saved successfully!")
+            QMessageBox.information(self, "Success", "Settings saved successfully!")
 
         except Exception as e:
-            logger.error(f"Error saving settings: {e}")
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to save settings: {str(e)}\n\n"
-                "Please check the logs for more details.",
-            )
+            self._on_save_failed(str(e))
+
+    def _on_save_failed(self, error: str):
+        """Report a failed settings write"""
+        logger.error(f"Error saving settings: {error}")
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to save settings: {error}\n\n"
+            "Please check the logs for more details.",
+        )
 
     def update_model_description(self, model_name):
         """Update model description based on selection"""
-        descriptions = {
-            "gpt-3.5-turbo": "Fast and efficient model for general text generation",
-            "gpt-4": "Most capable model for complex tasks and high-quality content",
-            "claude-3-opus": "Advanced model with strong reasoning capabilities",
-            "claude-3-sonnet": "Balanced model for most content generation tasks",
-            "claude-3-haiku": "Lightweight model for quick responses",
-            "google/gemini-2.5-pro-exp-03-25:free": "Google's latest Gemini model with advanced capabilities",
-        }
-        self.model_description.setText(descriptions.get(model_name, ""))
+        self.model_description.setText(self._MODEL_DESCRIPTIONS.get(model_name, ""))
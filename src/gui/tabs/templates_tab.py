@@ -6,6 +6,7 @@ class TemplatesTab(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._loaded = False
         self.init_ui()
 
     def init_ui(self):
@@ -14,6 +15,13 @@ class TemplatesTab(QWidget):
         layout.addWidget(QLabel("Templates"))
         self.setLayout(layout)
 
+    def showEvent(self, event):
+        """Load templates the first time the tab is shown"""
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            self.load_templates()
+
     def load_templates(self):
         """Load templates from database"""
         pass
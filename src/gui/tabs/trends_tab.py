@@ -6,6 +6,7 @@ class TrendsTab(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._loaded = False
         self.init_ui()
 
     def init_ui(self):
@@ -14,6 +15,13 @@ class TrendsTab(QWidget):
         layout.addWidget(QLabel("Trends"))
         self.setLayout(layout)
 
+    def showEvent(self, event):
+        """Load trends the first time the tab is shown"""
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            self.load_trends()
+
     def load_trends(self):
         """Load trend data"""
         pass
@@ -5,8 +5,7 @@ from PyQt5.QtWidgets import (
     QLabel,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QMessageBox,
     QFormLayout,
     QSpinBox,
@@ -14,18 +13,169 @@ from PyQt5.QtWidgets import (
     QGroupBox,
     QHeaderView,
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-import json
-import os
+from PyQt5.QtCore import (
+    Qt,
+    pyqtSignal,
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+)
+from PyQt5.QtGui import QBrush
 import logging
-import requests
-from typing import Dict, List, Optional
 import datetime
-from wordpress_xmlrpc import Client, WordPressPost
-from wordpress_xmlrpc.methods import posts
+import time
+from ._button_delegate import ButtonDelegate
+from ._config_cache import ConfigCache
 
 logger = logging.getLogger(__name__)
 
+# Seconds a successful connection test is reused for the same credentials
+PROBE_CACHE_TTL = 60
+
+
+class ConnTestSignals(QObject):
+    """Signal bridge for ConnTestWorker (QRunnable cannot emit signals itself)"""
+
+    result = pyqtSignal(bool, dict)  # Success, details of the probe
+
+
+class ConnTestWorker(QRunnable):
+    """Tests a WordPress site connection on a thread pool thread"""
+
+    def __init__(self, session, url, username, password):
+        super().__init__()
+        self.session = session
+        self.url = url
+        self.username = username
+        self.password = password
+        self.signals = ConnTestSignals()
+
+    def run(self):
+        details = {"url": self.url}
+
+        # First try REST API
+        try:
+            # One post with only its id; the total comes from X-WP-Total
+            with self.session.get(
+                f"{self.url}/wp-json/wp/v2/posts",
+                params={"per_page": 1, "_fields": "id"},
+                auth=(self.username, self.password),
+                timeout=30,
+            ) as response:
+                if response.status_code == 200:
+                    headers = response.headers
+                    details["method"] = "rest"
+                    details["version"] = headers.get("X-WP-Version", "Unknown")
+                    details["post_count"] = headers.get("X-WP-Total", "Unknown")
+                    self.signals.result.emit(True, details)
+                    return
+
+        except Exception as rest_error:
+            logger.warning(f"REST API test failed: {str(rest_error)}")
+
+        # If REST API fails, try XML-RPC
+        try:
+            from wordpress_xmlrpc import Client
+            from wordpress_xmlrpc.methods import posts
+
+            client = Client(f"{self.url}/xmlrpc.php", self.username, self.password)
+            # Test connection by getting recent posts
+            client.call(posts.GetPosts({"number": 1}))
+            details["method"] = "xmlrpc"
+            self.signals.result.emit(True, details)
+
+        except Exception as xmlrpc_error:
+            logger.error(f"XML-RPC test failed: {str(xmlrpc_error)}")
+            details["error"] = str(xmlrpc_error)
+            self.signals.result.emit(False, details)
+
+
+class SitesModel(QAbstractTableModel):
+    """Table model showing one page of WordPress site dicts"""
+
+    HEADERS = [
+        "URL",
+        "Username",
+        "Category",
+        "Interval",
+        "Max Posts",
+        "Status",
+        "Actions",
+    ]
+    # Interval and max posts are shown through strings cached on the site
+    KEYS = ("url", "username", "category", "_interval_str", "_max_posts_str")
+    DISPLAY_KEYS = ("_interval_str", "_max_posts_str")
+    STATUS_COLUMN = 5
+    # Fixed pixel widths so the header never measures cell contents
+    COLUMN_WIDTHS = (280, 120, 110, 70, 80, 100, 90)
+    CONNECTED_BRUSH = QBrush(Qt.green)
+    DISCONNECTED_BRUSH = QBrush(Qt.red)
+
+    def __init__(self, page_size, parent=None):
+        super().__init__(parent)
+        self._sites = []
+        self._page_offset = 0
+        self._page_size = page_size
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return max(0, min(self._page_size, len(self._sites) - self._page_offset))
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        site = self._sites[self._page_offset + index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col < len(self.KEYS):
+                return site[self.KEYS[col]]
+            if col == self.STATUS_COLUMN:
+                return (
+                    "Connected" if site.get("is_connected", False) else "Disconnected"
+                )
+        elif role == Qt.ForegroundRole and col == self.STATUS_COLUMN:
+            if site.get("is_connected", False):
+                return self.CONNECTED_BRUSH
+            return self.DISCONNECTED_BRUSH
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    @staticmethod
+    def cacheDisplay(site):
+        """Store the display strings of a site dict's numeric fields"""
+        site["_interval_str"] = str(site["post_interval"])
+        site["_max_posts_str"] = str(site["max_posts_per_day"])
+        return site
+
+    def setSites(self, sites, page_offset=0):
+        """Show the page of sites starting at page_offset"""
+        self.beginResetModel()
+        self._sites = sites
+        self._page_offset = page_offset
+        self.endResetModel()
+
+    def siteIndex(self, row):
+        """Return the index into the sites list of a displayed row"""
+        return self._page_offset + row
+
+    def setConnected(self, site_index, is_connected):
+        """Update the connection status of the site at site_index"""
+        self._sites[site_index]["is_connected"] = is_connected
+        row = site_index - self._page_offset
+        if 0 <= row < self.rowCount():
+            index = self.index(row, self.STATUS_COLUMN)
+            self.dataChanged.emit(index, index)
+
 
 class WordPressTab(QWidget):
     """Tab for managing WordPress sites"""
@@ -38,11 +188,35 @@ class WordPressTab(QWidget):
         super().__init__(parent)
         self.parent_window = parent
         self.sites = []
+        self._url_index = {}  # Site URL -> index into self.sites
         self.current_page = 0
         self.page_size = 10  # Number of sites to show per page
+        self._test_on_success = None
+        self._session = None
+        self._test_key = None
+        # (url, username, password) -> (monotonic time, details) of passed tests
+        self._probe_cache = {}
         self.init_ui()
         self.load_sites()
 
+    @property
+    def session(self):
+        """Lazily created HTTP session reused across connection tests"""
+        if self._session is None:
+            # Imported on first use to keep application startup light
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            self._session = requests.Session()
+            retry_strategy = Retry(total=2, backoff_factor=0.3)
+            adapter = HTTPAdapter(
+                pool_connections=8, pool_maxsize=8, max_retries=retry_strategy
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        return self._session
+
     def init_ui(self):
         """Initialize the UI components"""
         layout = QVBoxLayout()
@@ -127,20 +301,20 @@ class WordPressTab(QWidget):
         pagination_layout.addWidget(self.next_button)
         table_layout.addLayout(pagination_layout)
 
-        self.sites_table = QTableWidget()
-        self.sites_table.setColumnCount(7)
-        self.sites_table.setHorizontalHeaderLabels(
-            [
-                "URL",
-                "Username",
-                "Category",
-                "Interval",
-                "Max Posts",
-                "Status",
-                "Actions",
-            ]
-        )
-        self.sites_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.sites_model = SitesModel(self.page_size, self)
+        self.sites_table = QTableView()
+        self.sites_table.setModel(self.sites_model)
+        self.sites_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.remove_delegate = ButtonDelegate("Remove", self.sites_table)
+        self.remove_delegate.clicked.connect(self._on_remove_clicked)
+        self.sites_table.setItemDelegateForColumn(6, self.remove_delegate)
+        header = self.sites_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        for column, width in enumerate(SitesModel.COLUMN_WIDTHS):
+            header.resizeSection(column, width)
+        rows = self.sites_table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(24)
         table_layout.addWidget(self.sites_table)
 
         table_group.setLayout(table_layout)
@@ -153,14 +327,12 @@ class WordPressTab(QWidget):
     def load_sites(self):
         """Load WordPress sites from config with pagination"""
         try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), "config.json"
-            )
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                    self.sites = config.get("wordpress", {}).get("sites", [])
-                    self.update_table()
+            if ConfigCache.exists():
+                sites = ConfigCache.get().get("wordpress", {}).get("sites", [])
+                # Copy so edits stay out of the shared cache until saved
+                self.sites = [SitesModel.cacheDisplay(dict(site)) for site in sites]
+                self._rebuild_url_index()
+                self.update_table()
         except Exception as e:
             logger.error(f"Error loading WordPress sites: {e}")
             QMessageBox.critical(
@@ -173,19 +345,13 @@ class WordPressTab(QWidget):
     def save_sites(self):
         """Save WordPress sites to config"""
         try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), "config.json"
-            )
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-
-                if "wordpress" not in config:
-                    config["wordpress"] = {}
-                config["wordpress"]["sites"] = self.sites
-
-                with open(config_path, "w") as f:
-                    json.dump(config, f, indent=4)
+            if ConfigCache.exists():
+                wordpress = dict(ConfigCache.get().get("wordpress", {}))
+                wordpress["sites"] = [
+                    {k: v for k, v in site.items() if k not in SitesModel.DISPLAY_KEYS}
+                    for site in self.sites
+                ]
+                ConfigCache.update({"wordpress": wordpress})
 
                 # Emit signal for site updates
                 self.sites_updated.emit()
@@ -204,10 +370,14 @@ class WordPressTab(QWidget):
                 "Please check the logs for more details.",
             )
 
+    def _rebuild_url_index(self):
+        """Map each site URL to its position in self.sites"""
+        self._url_index = {site["url"]: i for i, site in enumerate(self.sites)}
+
     def update_table(self):
         """Update the sites table with pagination"""
         if not self.sites:
-            self.sites_table.setRowCount(0)
+            self.sites_model.setSites(self.sites)
             return
 
         # Calculate pagination
@@ -219,37 +389,12 @@ class WordPressTab(QWidget):
         self.prev_button.setEnabled(self.current_page > 0)
         self.next_button.setEnabled(self.current_page < total_pages - 1)
 
-        # Get current page data
-        start_idx = self.current_page * self.page_size
-        end_idx = min(start_idx + self.page_size, len(self.sites))
-        current_sites = self.sites[start_idx:end_idx]
-
-        # Update table
-        self.sites_table.setRowCount(len(current_sites))
-        for i, site in enumerate(current_sites):
-            self.sites_table.setItem(i, 0, QTableWidgetItem(site["url"]))
-            self.sites_table.setItem(i, 1, QTableWidgetItem(site["username"]))
-            self.sites_table.setItem(i, 2, QTableWidgetItem(site["category"]))
-            self.sites_table.setItem(i, 3, QTableWidgetItem(str(site["post_interval"])))
-            self.sites_table.setItem(
-                i, 4, QTableWidgetItem(str(site["max_posts_per_day"]))
-            )
-
-            # Status
-            status_item = QTableWidgetItem(
-                "Connected" if site.get("is_connected", False) else "Disconnected"
-            )
-            status_item.setForeground(
-                Qt.green if site.get("is_connected", False) else Qt.red
-            )
-            self.sites_table.setItem(i, 5, status_item)
+        # The model shows the current page without copying it
+        self.sites_model.setSites(self.sites, self.current_page * self.page_size)
 
-            # Remove button
-            remove_btn = QPushButton("Remove")
-            remove_btn.clicked.connect(
-                lambda checked, row=start_idx + i: self.remove_site(row)
-            )
-            self.sites_table.setCellWidget(i, 6, remove_btn)
+    def _on_remove_clicked(self, row):
+        """Remove the site shown at a row of the current page"""
+        self.remove_site(self.sites_model.siteIndex(row))
 
     def prev_page(self):
         """Go to previous page"""
@@ -282,23 +427,22 @@ class WordPressTab(QWidget):
             self.url_input.setText(url)
 
         # Check if site already exists
-        if any(site["url"] == url for site in self.sites):
+        if url in self._url_index:
             QMessageBox.warning(self, "Error", "This site is already added")
             return
 
-        # Show progress dialog
-        progress = QMessageBox(self)
-        progress.setWindowTitle("Adding Site")
-        progress.setText("Adding WordPress site...")
-        progress.setStandardButtons(QMessageBox.NoButton)
-        progress.show()
+        # Test connection before adding
+        self.test_connection(
+            on_success=lambda: self._save_new_site(
+                url, username, password, category, post_interval, max_posts
+            )
+        )
 
+    def _save_new_site(
+        self, url, username, password, category, post_interval, max_posts
+    ):
+        """Store a site whose connection test succeeded"""
         try:
-            # Test connection before adding
-            if not self.test_connection():
-                progress.close()
-                return
-
             # Add new site
             new_site = {
                 "url": url,
@@ -310,7 +454,9 @@ class WordPressTab(QWidget):
                 "is_connected": True,
                 "last_checked": datetime.datetime.now().isoformat(),
             }
+            SitesModel.cacheDisplay(new_site)
 
+            self._url_index[url] = len(self.sites)
             self.sites.append(new_site)
             self.save_sites()
             self.update_table()
@@ -320,11 +466,9 @@ class WordPressTab(QWidget):
             self.username_input.clear()
             self.password_input.clear()
 
-            progress.close()
             QMessageBox.information(self, "Success", "Site added successfully!")
 
         except Exception as e:
-            progress.close()
             logger.error(f"Error adding WordPress site: {e}")
             QMessageBox.critical(
                 self,
@@ -348,111 +492,83 @@ class WordPressTab(QWidget):
 
         if reply == QMessageBox.Yes:
             self.sites.pop(row)
+            self._rebuild_url_index()
             self.save_sites()
             self.update_table()
 
-    def test_connection(self):
-        """Test connection to WordPress site with improved error handling"""
+    def test_connection(self, on_success=None):
+        """Test connection to WordPress site without blocking the UI
+
+        on_success, if given, is called once the connection test succeeds.
+        """
         url = self.url_input.text().strip()
         username = self.username_input.text().strip()
         password = self.password_input.text().strip()
 
         if not all([url, username, password]):
             QMessageBox.warning(self, "Error", "Please fill in all required fields")
-            return False
+            return
 
-        # Show progress dialog
-        progress = QMessageBox(self)
-        progress.setWindowTitle("Testing Connection")
-        progress.setText("Testing WordPress connection...")
-        progress.setStandardButtons(QMessageBox.NoButton)
-        progress.show()
+        self._test_on_success = on_success
+        self._test_key = (url, username, password)
 
-        try:
-            # First try REST API
-            try:
-                response = requests.get(
-                    f"{url}/wp-json/wp/v2/posts",
-                    auth=(username, password),
-                    timeout=30,
-                    verify=False,
-                )
-
-                if response.status_code == 200:
-                    # Get WordPress version and site info
-                    site_info = response.json()
-                    wordpress_version = response.headers.get("X-WP-Version", "Unknown")
-
-                    # Close progress dialog
-                    progress.close()
-
-                    # Show success message with details
-                    QMessageBox.information(
-                        self,
-                        "Success",
-                        f"Connection successful!\n\n"
-                        f"WordPress Version: {wordpress_version}\n"
-                        f"Posts Found: {len(site_info)}",
-                    )
-
-                    # Update connection status in the form
-                    self.update_connection_status(True)
-                    return True
-
-            except Exception as rest_error:
-                logger.warning(f"REST API test failed: {str(rest_error)}")
-
-            # If REST API fails, try XML-RPC
-            try:
-                client = Client(f"{url}/xmlrpc.php", username, password)
-                # Test connection by getting recent posts
-                client.call(posts.GetPosts({"number": 1}))
-
-                # Close progress dialog
-                progress.close()
-
-                # Show success message
-                QMessageBox.information(
-                    self, "Success", "Connection successful using XML-RPC!"
-                )
-
-                # Update connection status in the form
-                self.update_connection_status(True)
-                return True
-
-            except Exception as xmlrpc_error:
-                logger.error(f"XML-RPC test failed: {str(xmlrpc_error)}")
-
-                # Close progress dialog
-                progress.close()
-
-                # Show error message
-                QMessageBox.warning(
-                    self,
-                    "Connection Error",
-                    "Could not connect to WordPress site. Please check:\n"
-                    "1. The site URL is correct\n"
-                    "2. XML-RPC is enabled on your WordPress site\n"
-                    "3. Your credentials are correct\n"
-                    "4. Your site is accessible",
-                )
+        # Reuse a recent successful test instead of probing the site again
+        cached = self._probe_cache.get(self._test_key)
+        if cached and time.monotonic() - cached[0] < PROBE_CACHE_TTL:
+            self._test_progress = None
+            self._on_connection_tested(True, dict(cached[1]))
+            return
 
-                self.update_connection_status(False)
-                return False
+        # Show progress dialog
+        self._test_progress = QMessageBox(self)
+        self._test_progress.setWindowTitle("Testing Connection")
+        self._test_progress.setText("Testing WordPress connection...")
+        self._test_progress.setStandardButtons(QMessageBox.NoButton)
+        self._test_progress.show()
+
+        worker = ConnTestWorker(self.session, url, username, password)
+        worker.signals.result.connect(self._on_connection_tested)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_connection_tested(self, ok, details):
+        """Report the result of a connection test run on the thread pool"""
+        if self._test_progress:
+            self._test_progress.close()
+        on_success, self._test_on_success = self._test_on_success, None
+        if ok and self._test_key and self._test_key[0] == details["url"]:
+            self._probe_cache[self._test_key] = (time.monotonic(), details)
+        self.update_connection_status(ok, details["url"])
+
+        if not ok:
+            QMessageBox.warning(
+                self,
+                "Connection Error",
+                "Could not connect to WordPress site. Please check:\n"
+                "1. The site URL is correct\n"
+                "2. XML-RPC is enabled on your WordPress site\n"
+                "3. Your credentials are correct\n"
+                "4. Your site is accessible",
+            )
+            return
 
-        except Exception as e:
-            progress.close()
-            logger.error(f"Error testing WordPress connection: {e}")
-            QMessageBox.critical(
+        # Show success message with details
+        if details["method"] == "rest":
+            QMessageBox.information(
                 self,
-                "Error",
-                f"Failed to test connection: {str(e)}\n\n"
-                "Please check the logs for more details.",
+                "Success",
+                f"Connection successful!\n\n"
+                f"WordPress Version: {details['version']}\n"
+                f"Posts Found: {details['post_count']}",
             )
-            self.update_connection_status(False)
-            return False
+        else:
+            QMessageBox.information(
+                self, "Success", "Connection successful using XML-RPC!"
+            )
+
+        if on_success:
+            on_success()
 
-    def update_connection_status(self, is_connected):
+    def update_connection_status(self, is_connected, url=None):
         """Update the connection status in the UI"""
         # Update the status in the current form
         if hasattr(self, "status_label"):
@@ -462,11 +578,12 @@ class WordPressTab(QWidget):
             )
 
         # Update the status in the sites table if this is an existing site
-        for i in range(self.sites_table.rowCount()):
-            if self.sites_table.item(i, 0).text() == self.url_input.text():
-                status_item = QTableWidgetItem(
-                    "Connected" if is_connected else "Disconnected"
-                )
-                status_item.setForeground(Qt.green if is_connected else Qt.red)
-                self.sites_table.setItem(i, 5, status_item)
-                break
+        if url is None:
+            url = self.url_input.text()
+        if not is_connected:
+            # Never reuse a successful test of a site that is now failing
+            for key in [key for key in self._probe_cache if key[0] == url]:
+                del self._probe_cache[key]
+        site_index = self._url_index.get(url)
+        if site_index is not None:
+            self.sites_model.setConnected(site_index, is_connected)
@@ -14,6 +14,31 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+LOGO_PATH = os.path.join(os.path.dirname(__file__), "assets", "logo.png")
+LOGO_SIZE = 200
+
+# (path, mtime, size) -> scaled logo, so reopening the screen skips the resample
+_LOGO_CACHE = {}
+
+
+def _scaled_logo(path=LOGO_PATH, size=LOGO_SIZE):
+    """Return the logo scaled to fit size x size, or None if it is missing"""
+    try:
+        key = (path, os.path.getmtime(path), size)
+    except OSError:
+        return None
+    pixmap = _LOGO_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        # create_assets.py already renders the logo at LOGO_SIZE
+        if pixmap.width() > size or pixmap.height() > size:
+            pixmap = pixmap.scaled(
+                size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
+        _LOGO_CACHE.clear()
+        _LOGO_CACHE[key] = pixmap
+    return pixmap
+
 
 class WelcomeScreen(QWidget):
     """Welcome screen with start button"""
@@ -31,15 +56,10 @@ class WelcomeScreen(QWidget):
         layout.setSpacing(20)
 
         # Logo
-        logo_path = os.path.join(os.path.dirname(__file__), "assets", "logo.png")
-        if os.path.exists(logo_path):
+        logo_pixmap = _scaled_logo()
+        if logo_pixmap is not None:
             logo_label = QLabel()
-            logo_pixmap = QPixmap(logo_path)
-            logo_label.setPixmap(
-                logo_pixmap.scaled(
-                    200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-            )
+            logo_label.setPixmap(logo_pixmap)
             logo_label.setAlignment(Qt.AlignCenter)
             layout.addWidget(logo_label)
 
@@ -1,11 +1,17 @@
 from PIL import Image, ImageDraw
 
+# create_icon.sh derives the 512@2x iconset entry from this, so keep 1024px
 size = 1024
-img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+
+# A two-entry palette image (transparent, purple) needs a quarter of the
+# memory of RGBA and encodes much faster, with identical pixels
+TRANSPARENT, CIRCLE = 0, 1
+img = Image.new("P", (size, size), TRANSPARENT)
+circle_color = (142, 45, 197)  # Match the highlight color from the app
+img.putpalette([0, 0, 0, *circle_color])
 draw = ImageDraw.Draw(img)
 
 # Draw a simple icon - purple circle
-circle_color = (142, 45, 197)  # Match the highlight color from the app
-draw.ellipse([size // 4, size // 4, 3 * size // 4, 3 * size // 4], fill=circle_color)
+draw.ellipse([size // 4, size // 4, 3 * size // 4, 3 * size // 4], fill=CIRCLE)
 
-img.save("icon.png")
+img.save("icon.png", transparency=TRANSPARENT)
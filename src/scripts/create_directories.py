@@ -15,6 +15,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Directory the required directories are created in, resolved once
+BASE_PATH = Path(__file__).resolve().parent.parent
+
 # Required directories
 REQUIRED_DIRS = [
     "data",
@@ -35,14 +38,20 @@ REQUIRED_DIRS = [
 
 
 def create_directories():
-    """Create all required directories."""
-    base_path = Path(__file__).parent.parent
+    """Create all required directories.
+
+    Returns the directories that did not exist before and those that failed.
+    """
+    base_path = BASE_PATH
     created_dirs = []
     failed_dirs = []
 
-    for dir_path in REQUIRED_DIRS:
+    # Sorted so parents are handled before their children; deduplicated
+    for dir_path in sorted(dict.fromkeys(REQUIRED_DIRS)):
         full_path = base_path / dir_path
         try:
+            if full_path.is_dir():
+                continue
             full_path.mkdir(parents=True, exist_ok=True)
             created_dirs.append(dir_path)
             logger.info(f"Created directory: {dir_path}")
@@ -53,15 +62,45 @@ def create_directories():
     return created_dirs, failed_dirs
 
 
-def create_initial_files():
-    """Create initial files in the directories."""
-    base_path = Path(__file__).parent.parent
+def _create_file(path: Path, content: str = "") -> bool:
+    """Create a file unless it exists, using one open and at most one write.
+
+    Returns False if the file already existed.
+    """
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        if content:
+            os.write(fd, content.encode("utf-8"))
+    finally:
+        os.close(fd)
+    return True
+
+
+def create_initial_files(created_dirs=None):
+    """Create initial files in the directories.
+
+    If created_dirs is given, only those freshly created directories get a
+    .gitkeep, which avoids listing every required directory.
+    """
+    base_path = BASE_PATH
+
+    if created_dirs is None:
+        # Create .gitkeep files in empty directories
+        empty_dirs = [
+            dir_path
+            for dir_path in REQUIRED_DIRS
+            if not any((base_path / dir_path).iterdir())
+        ]
+    else:
+        # A new directory is empty unless another required one was made in it
+        parents = {str(Path(dir_path).parent) for dir_path in REQUIRED_DIRS}
+        empty_dirs = [dir_path for dir_path in created_dirs if dir_path not in parents]
 
-    # Create .gitkeep files in empty directories
-    for dir_path in REQUIRED_DIRS:
-        gitkeep_path = base_path / dir_path / ".gitkeep"
-        if not any((base_path / dir_path).iterdir()):
-            gitkeep_path.touch()
+    for dir_path in empty_dirs:
+        if _create_file(base_path / dir_path / ".gitkeep"):
             logger.info(f"Created .gitkeep in {dir_path}")
 
     # Create initial README files
@@ -73,9 +112,8 @@ def create_initial_files():
     }
 
     for path, content in readme_paths.items():
-        readme_file = base_path / path / "README.md"
-        if not readme_file.exists():
-            readme_file.write_text(content)
+        # O_EXCL does the existence check as part of the open
+        if _create_file(base_path / path / "README.md", content):
             logger.info(f"Created README.md in {path}")
 
 
@@ -96,7 +134,7 @@ def main():
             logger.error(f"  ✗ {dir_path}: {error}")
 
     logger.info("\nCreating initial files...")
-    create_initial_files()
+    create_initial_files(created_dirs)
 
     if not failed_dirs:
         logger.info("\nDirectory setup completed successfully!")
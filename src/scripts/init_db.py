@@ -8,14 +8,14 @@ import os
 import sys
 import logging
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.utils.database import db_manager, Base, Pin
+from src.utils.database import db_manager, Base, Pin, set_sqlite_pragmas
 from src.utils.config import get_config
 
 # Configure logging
@@ -26,6 +26,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+POOL_SIZE = 5
+
 
 def init_database():
     """Initialize the database with required tables"""
@@ -35,19 +37,47 @@ def init_database():
         db_config = config.get("database", {})
 
         # Create database engine with default SQLite if no config
+        db_url = db_config.get("url", "sqlite:///app.db")
+        is_sqlite = db_url.startswith("sqlite")
         engine = create_engine(
-            db_config.get("url", "sqlite:///app.db"),
+            db_url,
             poolclass=QueuePool,
-            pool_size=5,
+            pool_size=POOL_SIZE,
             max_overflow=10,
             pool_timeout=30,
             pool_recycle=1800,
+            connect_args={"check_same_thread": False} if is_sqlite else {},
         )
-
-        # Create tables
-        Base.metadata.create_all(engine)
+        if is_sqlite:
+            event.listen(engine, "connect", set_sqlite_pragmas)
+
+        # Create tables and indexes in one transaction on one connection
+        with engine.begin() as conn:
+            Base.metadata.create_all(bind=conn)
+
+            # create_all skips existing tables, so add newer columns and
+            # indexes explicitly
+            inspector = inspect(conn)
+            for table in Base.metadata.sorted_tables:
+                existing = {col["name"] for col in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name not in existing:
+                        column_type = column.type.compile(conn.dialect)
+                        conn.execute(
+                            text(
+                                f"ALTER TABLE {table.name} "
+                                f"ADD COLUMN {column.name} {column_type}"
+                            )
+                        )
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
         logger.info("Database tables created successfully")
 
+        # Pre-fill the pool so the first requests do not pay for connecting
+        connections = [engine.connect() for _ in range(POOL_SIZE)]
+        for conn in connections:
+            conn.close()
+
         # Initialize database manager
         db_manager.init(engine)
         logger.info("Database manager initialized")
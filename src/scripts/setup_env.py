@@ -17,6 +17,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+
 # Required environment variables
 REQUIRED_ENV_VARS = {
     "OPENAI_API_KEY": {
@@ -64,7 +66,7 @@ def get_env_value(var_name: str, description: str, secure: bool) -> Optional[str
 def load_env_file() -> Dict[str, str]:
     """Load existing environment variables from .env file."""
     env_vars = {}
-    env_path = Path(__file__).parent.parent / ".env"
+    env_path = ENV_PATH
 
     if env_path.exists():
         with open(env_path) as f:
@@ -79,7 +81,7 @@ def load_env_file() -> Dict[str, str]:
 
 def save_env_file(env_vars: Dict[str, str]):
     """Save environment variables to .env file."""
-    env_path = Path(__file__).parent.parent / ".env"
+    env_path = ENV_PATH
 
     with open(env_path, "w") as f:
         f.write("# AutoPinner Pro Environment Variables\n")
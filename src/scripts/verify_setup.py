@@ -9,10 +9,13 @@ import sys
 import logging
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.exc import SQLAlchemyError
 from src.utils.config import get_config
 
@@ -27,6 +30,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeout in seconds for API probes
+REQUEST_TIMEOUT = (3.05, 10)
+
+REQUIRED_ENV_VARS = (
+    "OPENAI_API_KEY",
+    "PINTEREST_ACCESS_TOKEN",
+    "PINTEREST_APP_ID",
+    "PINTEREST_APP_SECRET",
+    "DATABASE_URL",
+)
+REQUIRED_DIRS = (
+    "data",
+    "data/images",
+    "data/exports",
+    "logs",
+    "templates",
+    "templates/content",
+)
+REQUIRED_TABLES = frozenset(
+    {"settings", "tasks", "content", "pins", "analytics", "logs"}
+)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _group_by_parent(paths):
+    """Map each parent directory to the set of names required inside it"""
+    groups = {}
+    for path in paths:
+        parent, name = os.path.split(path)
+        groups.setdefault(parent or ".", set()).add(name)
+    return groups
+
+
+_REQUIRED_DIRS_BY_PARENT = _group_by_parent(REQUIRED_DIRS)
+
 
 class SetupVerifier:
     """Class to verify all components of the system."""
@@ -35,21 +73,25 @@ class SetupVerifier:
         """Initialize the verifier with environment variables."""
         load_dotenv()
         self.config = get_config()
+        # Snapshot of the variables the checks read
+        self._env = {var: os.getenv(var) for var in REQUIRED_ENV_VARS}
+
+        # One pooled session so the API probes reuse keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Close the HTTP session."""
+        self.session.close()
 
     def verify_env_file(self):
         """Verify .env file exists and contains required variables."""
-        required_vars = [
-            "OPENAI_API_KEY",
-            "PINTEREST_ACCESS_TOKEN",
-            "PINTEREST_APP_ID",
-            "PINTEREST_APP_SECRET",
-            "DATABASE_URL",
-        ]
-
-        missing_vars = []
-        for var in required_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
+        missing_vars = [var for var in REQUIRED_ENV_VARS if not self._env[var]]
 
         if missing_vars:
             logger.error(f"Missing required environment variables: {missing_vars}")
@@ -61,28 +103,20 @@ class SetupVerifier:
     def verify_database(self):
         """Verify database connection and structure."""
         try:
-            db_url = os.getenv("DATABASE_URL", "sqlite:///autopinner.db")
+            db_url = self._env["DATABASE_URL"] or "sqlite:///autopinner.db"
             engine = create_engine(db_url)
 
-            with engine.connect() as conn:
-                # Check if tables exist
-                tables = engine.table_names()
-                required_tables = [
-                    "settings",
-                    "tasks",
-                    "content",
-                    "pins",
-                    "analytics",
-                    "logs",
-                ]
-
-                missing_tables = [
-                    table for table in required_tables if table not in tables
-                ]
-
-                if missing_tables:
-                    logger.error(f"Missing required tables: {missing_tables}")
-                    return False
+            try:
+                # Reflect the table names once over a single connection
+                with engine.connect() as conn:
+                    present = frozenset(inspect(conn).get_table_names())
+            finally:
+                engine.dispose()
+
+            missing_tables = REQUIRED_TABLES - present
+            if missing_tables:
+                logger.error(f"Missing required tables: {sorted(missing_tables)}")
+                return False
 
             logger.info("Database verification passed")
             return True
@@ -94,18 +128,19 @@ class SetupVerifier:
     def verify_openai_api(self):
         """Verify OpenAI API connection."""
         try:
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = self._env["OPENAI_API_KEY"]
             if not api_key:
                 logger.error("OpenAI API key not found")
                 return False
 
             # Test API connection
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            }
+            headers = dict(JSON_HEADERS, Authorization=f"Bearer {api_key}")
 
-            response = requests.get("https://api.openai.com/v1/models", headers=headers)
+            response = self.session.get(
+                "https://api.openai.com/v1/models",
+                headers=headers,
+                timeout=REQUEST_TIMEOUT,
+            )
 
             if response.status_code != 200:
                 logger.error(f"OpenAI API verification failed: {response.text}")
@@ -121,19 +156,18 @@ class SetupVerifier:
     def verify_pinterest_api(self):
         """Verify Pinterest API connection."""
         try:
-            access_token = os.getenv("PINTEREST_ACCESS_TOKEN")
+            access_token = self._env["PINTEREST_ACCESS_TOKEN"]
             if not access_token:
                 logger.error("Pinterest access token not found")
                 return False
 
             # Test API connection
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json",
-            }
+            headers = dict(JSON_HEADERS, Authorization=f"Bearer {access_token}")
 
-            response = requests.get(
-                "https://api.pinterest.com/v5/user_account", headers=headers
+            response = self.session.get(
+                "https://api.pinterest.com/v5/user_account",
+                headers=headers,
+                timeout=REQUEST_TIMEOUT,
             )
 
             if response.status_code != 200:
@@ -148,24 +182,28 @@ class SetupVerifier:
             return False
 
     def verify_directories(self):
-        """Verify required directories exist."""
-        required_dirs = [
-            "data",
-            "data/images",
-            "data/exports",
-            "logs",
-            "templates",
-            "templates/content",
-        ]
-
+        """Verify required directories exist, creating any that are missing."""
+        # List each parent once instead of stat()ing every directory
         missing_dirs = []
-        for dir_path in required_dirs:
-            if not os.path.exists(dir_path):
-                missing_dirs.append(dir_path)
+        for parent, names in _REQUIRED_DIRS_BY_PARENT.items():
+            try:
+                with os.scandir(parent) as entries:
+                    existing = {entry.name for entry in entries if entry.is_dir()}
+            except FileNotFoundError:
+                existing = set()
+            missing_dirs.extend(
+                os.path.join(parent, name) if parent != "." else name
+                for name in names - existing
+            )
 
         if missing_dirs:
-            logger.error(f"Missing required directories: {missing_dirs}")
-            return False
+            try:
+                for dir_path in sorted(missing_dirs):
+                    os.makedirs(dir_path, exist_ok=True)
+            except OSError as e:
+                logger.error(f"Missing required directories: {missing_dirs} ({e})")
+                return False
+            logger.warning(f"Created missing directories: {sorted(missing_dirs)}")
 
         logger.info("Directory structure verification passed")
         return True
@@ -180,15 +218,21 @@ class SetupVerifier:
             "Directory Structure": self.verify_directories,
         }
 
-        results = {}
-        all_passed = True
-
-        for name, verify_func in verifications.items():
-            logger.info(f"Verifying {name}...")
-            result = verify_func()
-            results[name] = result
-            if not result:
-                all_passed = False
+        # The checks are independent, so the network probes run concurrently
+        with ThreadPoolExecutor(max_workers=len(verifications)) as executor:
+            futures = {}
+            for name, verify_func in verifications.items():
+                logger.info(f"Verifying {name}...")
+                futures[name] = executor.submit(verify_func)
+            results = {}
+            for name, future in futures.items():
+                # A crashing check fails on its own without losing the others
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"{name} verification failed: {e}")
+                    results[name] = False
+        all_passed = all(results.values())
 
         # Print summary
         logger.info("\nVerification Summary:")
@@ -201,8 +245,12 @@ class SetupVerifier:
 
 if __name__ == "__main__":
     verifier = SetupVerifier()
+    try:
+        passed = verifier.verify_all()
+    finally:
+        verifier.close()
 
-    if verifier.verify_all():
+    if passed:
         logger.info("\nAll verifications passed successfully!")
         sys.exit(0)
     else:
@@ -1,112 +1,109 @@
-import logging
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import asyncio
 import json
-from typing import Dict, Any, Optional
-from flask import Flask, jsonify
+import logging
 import threading
+from aiohttp import web
+
+from src.utils.json_utils import load_json
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for the server thread to finish shutting down
+SHUTDOWN_TIMEOUT = 5
+
+# Response bodies never change, so they are encoded once
+HEALTHY_BODY = json.dumps({"status": "healthy"}).encode()
+RUNNING_BODY = json.dumps({"status": "running"}).encode()
+STATS_BODY = json.dumps({"status": "ok", "data": {}}).encode()
+SUCCESS_BODY = json.dumps({"status": "success"}).encode()
+ERROR_BODY = json.dumps({"status": "error"}).encode()
+
+
+def _json_response(body: bytes, status: int = 200) -> web.Response:
+    """Wrap pre-encoded JSON bytes in a response"""
+    return web.Response(body=body, status=status, content_type="application/json")
+
 
 class ApiServer:
     """API server for external access"""
 
     def __init__(self, port=5000):
-        self.app = Flask(__name__)
+        self.app = web.Application()
         self.port = port
         self.server = None
+        self._loop = None
+        self._started = threading.Event()
+        self._error = None
         self.setup_routes()
 
     def setup_routes(self):
         """Setup API routes"""
+        self.app.router.add_get("/health", self.health_check)
+        self.app.router.add_get("/status", self.get_status)
+        self.app.router.add_get("/stats", self.get_stats)
+        self.app.router.add_post("/wordpress/sites", self.post_wordpress_sites)
 
-        @self.app.route("/health")
-        def health_check():
-            return jsonify({"status": "healthy"})
+    async def health_check(self, request):
+        return _json_response(HEALTHY_BODY)
 
-        @self.app.route("/stats")
-        def get_stats():
-            return jsonify({"status": "ok", "data": {}})
+    async def get_status(self, request):
+        return _json_response(RUNNING_BODY)
 
-    def start(self):
-        """Start the API server"""
+    async def get_stats(self, request):
+        return _json_response(STATS_BODY)
+
+    async def post_wordpress_sites(self, request):
         try:
-            self.server = threading.Thread(
-                target=self.app.run, kwargs={"host": "0.0.0.0", "port": self.port}
-            )
-            self.server.daemon = True
-            self.server.start()
-            logger.info(f"API server started on port {self.port}")
+            # Parse the raw bytes without decoding them to str first
+            load_json(await request.read())
+            return _json_response(SUCCESS_BODY)
         except Exception as e:
-            logger.error(f"Error starting API server: {e}")
-            raise
-
-    def stop(self):
-        """Stop the API server"""
-        if self.server and self.server.is_alive():
-            # Implementation for graceful shutdown
-            logger.info("API server stopped")
-
+            logger.error(f"Error handling POST request: {e}")
+            return _json_response(ERROR_BODY, status=500)
+
+    def _run(self):
+        """Serve the app on a private event loop until stop() is called"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        runner = web.AppRunner(self.app, access_log=None)
+        try:
+            loop.run_until_complete(runner.setup())
+            site = web.TCPSite(runner, "0.0.0.0", self.port)
+            loop.run_until_complete(site.start())
+        except Exception as e:
+            self._error = e
+            loop.run_until_complete(runner.cleanup())
+            loop.close()
+            self._started.set()
+            return
 
-class APIServer:
-    def __init__(self, port: int = 5000):
-        self.port = port
-        self.server: Optional[HTTPServer] = None
+        self._started.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(runner.cleanup())
+            loop.close()
 
     def start(self):
         """Start the API server"""
         try:
-            self.server = HTTPServer(("localhost", self.port), APIRequestHandler)
+            self.server = threading.Thread(target=self._run, name="ApiServer")
+            self.server.daemon = True
+            self.server.start()
+
+            # Surface bind errors here rather than losing them in the thread
+            self._started.wait()
+            if self._error:
+                raise self._error
             logger.info(f"API server started on port {self.port}")
-            self.server.serve_forever()
         except Exception as e:
             logger.error(f"Error starting API server: {e}")
             raise
 
     def stop(self):
         """Stop the API server"""
-        if self.server:
-            self.server.shutdown()
-            self.server.server_close()
+        if self.server and self.server.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self.server.join(SHUTDOWN_TIMEOUT)
             logger.info("API server stopped")
-
-
-class APIRequestHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        """Handle GET requests"""
-        try:
-            if self.path == "/status":
-                self.send_response(200)
-                self.send_header("Content-type", "application/json")
-                self.end_headers()
-                response = {"status": "running"}
-                self.wfile.write(json.dumps(response).encode())
-            else:
-                self.send_response(404)
-                self.end_headers()
-        except Exception as e:
-            logger.error(f"Error handling GET request: {e}")
-            self.send_response(500)
-            self.end_headers()
-
-    def do_POST(self):
-        """Handle POST requests"""
-        try:
-            content_length = int(self.headers["Content-Length"])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode())
-
-            if self.path == "/wordpress/sites":
-                # Handle WordPress sites
-                self.send_response(200)
-                self.send_header("Content-type", "application/json")
-                self.end_headers()
-                response = {"status": "success"}
-                self.wfile.write(json.dumps(response).encode())
-            else:
-                self.send_response(404)
-                self.end_headers()
-        except Exception as e:
-            logger.error(f"Error handling POST request: {e}")
-            self.send_response(500)
-            self.end_headers()
@@ -1,10 +1,31 @@
-import json
+import atexit
 import os
 import logging
+import threading
+import weakref
 from typing import Any, Dict, Optional
 
+from src.utils.json_utils import load_json, dump_json
+
 logger = logging.getLogger(__name__)
 
+# Seconds to wait after a set() so consecutive changes share one write
+SAVE_DELAY = 0.5
+
+# Managers whose delayed saves are flushed at exit, held weakly so
+# registering one does not keep it alive
+_MANAGERS = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    """Write out changes still waiting for their delayed save"""
+    for manager in list(_MANAGERS):
+        try:
+            manager.flush()
+        except Exception:
+            pass  # save_config has already logged the failure
+
 
 def get_config(config_path: str = "config.json") -> Dict[str, Any]:
     """Load configuration from file or return default config"""
@@ -21,14 +42,14 @@ def get_config(config_path: str = "config.json") -> Dict[str, Any]:
 
     try:
         if os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                config = json.load(f)
+            with open(config_path, "rb") as f:
+                config = load_json(f.read())
                 # Merge with default config to ensure all keys exist
                 return {**default_config, **config}
         else:
             # Create default config file
-            with open(config_path, "w") as f:
-                json.dump(default_config, f, indent=4)
+            with open(config_path, "wb") as f:
+                f.write(dump_json(default_config))
             return default_config
     except Exception as e:
         logger.error(f"Error loading config: {e}")
@@ -39,14 +60,18 @@ class ConfigManager:
     def __init__(self, config_path: str = "config.json"):
         self.config_path = config_path
         self.config: Dict[str, Any] = {}
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
         self.load_config()
+        _MANAGERS.add(self)
 
     def load_config(self):
         """Load configuration from file"""
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, "r") as f:
-                    self.config = json.load(f)
+                with open(self.config_path, "rb") as f:
+                    self.config = load_json(f.read())
                 logger.info(f"Configuration loaded from {self.config_path}")
             else:
                 self.config = self.get_default_config()
@@ -58,22 +83,53 @@ class ConfigManager:
 
     def save_config(self):
         """Save configuration to file"""
+        with self._lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            try:
+                tmp_path = self.config_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(dump_json(self.config))
+                os.replace(tmp_path, self.config_path)
+                self._dirty = False
+                logger.info(f"Configuration saved to {self.config_path}")
+            except Exception as e:
+                logger.error(f"Error saving configuration: {e}")
+                raise
+
+    def flush(self):
+        """Save configuration now if it has unsaved changes"""
+        with self._lock:
+            if self._dirty:
+                self.save_config()
+
+    def _flush_later(self):
+        """Delayed save run on the timer thread"""
         try:
-            with open(self.config_path, "w") as f:
-                json.dump(self.config, f, indent=4)
-            logger.info(f"Configuration saved to {self.config_path}")
+            self.flush()
         except Exception as e:
-            logger.error(f"Error saving configuration: {e}")
-            raise
+            # No caller to raise to; the changes stay dirty, so the next
+            # set(), flush() or exit retries the save
+            logger.error(f"Delayed configuration save failed: {e}")
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value"""
         return self.config.get(key, default)
 
     def set(self, key: str, value: Any):
-        """Set a configuration value"""
-        self.config[key] = value
-        self.save_config()
+        """Set a configuration value, saving it shortly afterwards
+
+        The save happens on a timer thread, so write errors are logged
+        rather than raised here; call flush() to save and see them.
+        """
+        with self._lock:
+            self.config[key] = value
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY, self._flush_later)
+                self._save_timer.daemon = True
+                self._save_timer.start()
 
     def get_default_config(self) -> Dict[str, Any]:
         """Get default configuration"""
@@ -1,4 +1,14 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, JSON, Boolean
+from sqlalchemy import (
+    create_engine,
+    event,
+    Column,
+    Integer,
+    String,
+    DateTime,
+    JSON,
+    Boolean,
+    Index,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.pool import QueuePool
@@ -8,6 +18,7 @@ from contextlib import contextmanager
 import sqlite3
 from typing import Optional, Dict, Any, List
 import gc
+import os
 import psutil
 import threading
 from queue import Queue
@@ -18,6 +29,17 @@ logger = logging.getLogger(__name__)
 Base = declarative_base()
 
 
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for concurrent writes"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
 class Pin(Base):
     """Pin model for storing Pinterest pin data"""
 
@@ -31,11 +53,15 @@ class Pin(Base):
     image_url = Column(String)
     content_type = Column(String)
     keywords = Column(String)
-    status = Column(String)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    status = Column(String, index=True)
+    wordpress_site = Column(String)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
     engagement_data = Column(JSON)
     is_published = Column(Boolean, default=False)
 
+    # Serves get_pending_pins, which filters on both columns
+    __table_args__ = (Index("ix_pins_status_site", "status", "wordpress_site"),)
+
 
 class DatabaseManager:
     """Enhanced database manager with connection pooling and memory optimization"""
@@ -45,11 +71,14 @@ class DatabaseManager:
     _session_factory = None
     _engine = None
     _connection_pool = None
-    _max_connections = 20
+    # Scale the pool with the cores that can actually run queries
+    _max_connections = min(32, (os.cpu_count() or 4) * 2)
+    _database_url = "sqlite:///app.db"
     _connection_timeout = 30
     _cleanup_interval = 300  # 5 minutes
-    _last_cleanup = time.time()
     _memory_threshold = 0.8  # 80% memory usage threshold
+    _cleanup_thread = None
+    _stop_cleanup = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -63,13 +92,20 @@ class DatabaseManager:
         if self._engine is None:
             if engine is None:
                 engine = create_engine(
-                    "sqlite:///app.db",
+                    self._database_url,
                     poolclass=QueuePool,
                     pool_size=self._max_connections,
-                    max_overflow=10,
+                    max_overflow=self._max_connections // 2,
                     pool_timeout=self._connection_timeout,
                     pool_recycle=1800,
+                    # Server connections can be dropped while idle; a local
+                    # SQLite file cannot, so it skips the liveness check
+                    pool_pre_ping=not self._database_url.startswith("sqlite"),
                 )
+            if engine.dialect.name == "sqlite" and not event.contains(
+                engine, "connect", set_sqlite_pragmas
+            ):
+                event.listen(engine, "connect", set_sqlite_pragmas)
             self._engine = engine
             self._session_factory = scoped_session(
                 sessionmaker(
@@ -79,6 +115,12 @@ class DatabaseManager:
                     autoflush=False,
                 )
             )
+            # Memory is checked periodically, not on every session close
+            self._stop_cleanup = threading.Event()
+            self._cleanup_thread = threading.Thread(
+                target=self._cleanup_loop, name="DatabaseCleanup", daemon=True
+            )
+            self._cleanup_thread.start()
 
     @contextmanager
     def get_session(self):
@@ -95,16 +137,21 @@ class DatabaseManager:
         finally:
             if session:
                 session.close()
-            self._check_memory_usage()
 
-    def _check_memory_usage(self):
-        """Check memory usage and perform cleanup if necessary"""
-        current_time = time.time()
-        if current_time - self._last_cleanup > self._cleanup_interval:
-            memory_percent = psutil.Process().memory_percent()
-            if memory_percent > self._memory_threshold:
-                self._perform_cleanup()
-            self._last_cleanup = current_time
+    def _cleanup_loop(self):
+        """Collect garbage whenever memory usage is high at a periodic check
+
+        Scoped sessions are thread-local, so they are left to the threads
+        that own them; this thread only checks memory and runs the GC.
+        """
+        process = psutil.Process()
+        while not self._stop_cleanup.wait(self._cleanup_interval):
+            try:
+                if process.memory_percent() > self._memory_threshold:
+                    gc.collect()
+                    logger.info("Garbage collected after high memory usage")
+            except Exception as e:
+                logger.error(f"Error checking memory usage: {e}")
 
     def _perform_cleanup(self):
         """Perform memory cleanup"""
@@ -112,18 +159,33 @@ class DatabaseManager:
             # Force garbage collection
             gc.collect()
 
-            # Clear SQLAlchemy session cache
+            # Clear SQLAlchemy session cache; the pool stays warm, only
+            # close_all() disposes it
             if self._session_factory:
                 self._session_factory.remove()
 
-            # Clear connection pool
-            if self._engine:
-                self._engine.dispose()
-
             logger.info("Database cleanup performed")
         except Exception as e:
             logger.error(f"Error during database cleanup: {e}")
 
+    def close_all(self):
+        """Close all sessions and pooled connections; they reopen on next use"""
+        if self._session_factory:
+            self._session_factory.remove()
+        if self._engine:
+            self._engine.dispose()
+
+    def shutdown(self):
+        """Stop the memory check thread and close all connections"""
+        if self._stop_cleanup:
+            self._stop_cleanup.set()
+        self.close_all()
+
+    def cleanup(self):
+        """Release the current thread's session without disposing the pool"""
+        if self._session_factory:
+            self._session_factory.remove()
+
     def get_pins_by_status(self, status: str, limit: int = 100) -> List[Pin]:
         """Get pins by status with memory optimization"""
         with self.get_session() as session:
@@ -175,16 +237,39 @@ class DatabaseManager:
             logger.error(f"Error deleting pin: {e}")
             return False
 
-    def __del__(self):
-        """Cleanup resources on deletion"""
-        self._perform_cleanup()
+
+def backup_sqlite_database(src_path: str, dst_path: str):
+    """Copy a live SQLite database using the online backup API"""
+    src = sqlite3.connect(src_path)
+    try:
+        dst = sqlite3.connect(dst_path)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+    finally:
+        src.close()
 
 
 # Create global database manager instance
 db_manager = DatabaseManager()
 
-# Create a Session class for direct session management
-Session = scoped_session(sessionmaker(bind=db_manager._engine, expire_on_commit=False))
+
+# Kept callable under its old class-like name for direct session management
+def Session():
+    """Return a session from the shared pool, initializing it on first use"""
+    if db_manager._session_factory is None:
+        db_manager.init()
+    return db_manager._session_factory()
+
 
 # Export these objects
-__all__ = ["Session", "Pin", "DatabaseManager", "db_manager", "Base"]
+__all__ = [
+    "Session",
+    "Pin",
+    "DatabaseManager",
+    "db_manager",
+    "Base",
+    "backup_sqlite_database",
+    "set_sqlite_pragmas",
+]
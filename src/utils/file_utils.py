@@ -0,0 +1,51 @@
+import os
+import sys
+import shutil
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Size of the reusable copy buffer (1 MiB)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _sendfile_copy(src: str, dst: str) -> None:
+    """Copy file contents in kernel space with os.sendfile"""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+
+
+def _buffered_copy(src: str, dst: str, buffer_size: int) -> None:
+    """Copy file contents through a single preallocated buffer"""
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        while True:
+            read = fsrc.readinto(buffer)
+            if not read:
+                break
+            fdst.write(view[:read])
+
+
+def fast_copy(src: str, dst: str, buffer_size: int = COPY_BUFFER_SIZE) -> None:
+    """Copy a file and preserve metadata, using zero-copy sendfile on Linux.
+
+    Other platforms use a buffered copy; shutil.copy2 is the last resort.
+    """
+    try:
+        if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+            _sendfile_copy(src, dst)
+        else:
+            _buffered_copy(src, dst, buffer_size)
+        shutil.copystat(src, dst)
+    except OSError as e:
+        logger.warning(f"Fast copy failed, falling back to shutil.copy2: {e}")
+        shutil.copy2(src, dst)
@@ -0,0 +1,22 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib json module
+    orjson = None
+
+
+def load_json(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dump_json(obj) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed
+
+    orjson indents cheaply; the stdlib fallback writes compact JSON since
+    indenting roughly triples its encoding time.
+    """
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
@@ -1,17 +1,48 @@
+import base64
 import hashlib
 import json
 import os
 import requests
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 import jwt
+from requests.adapters import HTTPAdapter
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
 import platform
 import uuid
 
 logger = logging.getLogger(__name__)
 
+LICENSE_API_URL = "https://api.tikgen.com/v1"
+REQUEST_TIMEOUT = 10
+# Seconds a validation result is reused before asking the server again
+VALIDATION_CACHE_TTL = 60
+ENCRYPTION_KEY_FILE = ".encryption_key"
+NONCE_SIZE = 12
+# Every Fernet token starts with its base64-encoded 0x80 version byte
+FERNET_TOKEN_PREFIX = "gAAAAA"
+
+# Invariant for the process lifetime, so shared by all LicenseManager instances
+_HARDWARE_ID = None
+_ENCRYPTION_KEY = None
+
+# Single writer so license file writes stay ordered and off the caller's
+# thread; its worker is joined at interpreter exit, so no write is lost
+_LICENSE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LicenseWriter")
+# Future of the most recent write; writes run in order, so it finishes last
+_LAST_LICENSE_WRITE = None
+
+
+def _log_write_failure(future):
+    """Report a license file write that failed on the writer thread"""
+    error = future.exception()
+    if error:
+        logger.error(f"Error writing license file: {error}")
+
 
 class LicenseManager:
     """Manages software licensing and access control"""
@@ -19,29 +50,42 @@ class LicenseManager:
     def __init__(self):
         self.license_file = "license.key"
         self.license_data = None
-        self.fernet = None
+        self.fernet = None  # Only decrypts license files from older versions
+        self._aead = None
+        self._cached_validation = None  # (monotonic time, result)
+        self._validate_request = None  # (body bytes, headers) for this license
+        # Keep-alive pool shared by all license server calls
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
         self._init_encryption()
         self.load_license()
 
     def _init_encryption(self):
         """Initialize encryption key"""
+        global _ENCRYPTION_KEY
         try:
-            # Generate or load encryption key
-            key_file = ".encryption_key"
-            if os.path.exists(key_file):
-                with open(key_file, "rb") as f:
-                    key = f.read()
-            else:
-                key = Fernet.generate_key()
-                with open(key_file, "wb") as f:
-                    f.write(key)
-            self.fernet = Fernet(key)
+            # Generate or load encryption key once per process
+            if _ENCRYPTION_KEY is None:
+                if os.path.exists(ENCRYPTION_KEY_FILE):
+                    with open(ENCRYPTION_KEY_FILE, "rb") as f:
+                        key = f.read()
+                else:
+                    # Same url-safe base64 of 32 random bytes as a Fernet key
+                    key = base64.urlsafe_b64encode(ChaCha20Poly1305.generate_key())
+                    with open(ENCRYPTION_KEY_FILE, "wb") as f:
+                        f.write(key)
+                _ENCRYPTION_KEY = key
+            self.fernet = Fernet(_ENCRYPTION_KEY)
+            self._aead = ChaCha20Poly1305(base64.urlsafe_b64decode(_ENCRYPTION_KEY))
         except Exception as e:
             logger.error(f"Error initializing encryption: {e}")
             raise
 
     def _get_hardware_id(self) -> str:
-        """Generate unique hardware ID"""
+        """Return the unique hardware ID, computing it on first use"""
+        global _HARDWARE_ID
+        if _HARDWARE_ID is not None:
+            return _HARDWARE_ID
         try:
             # Get system information
             system_info = {
@@ -52,11 +96,11 @@ class LicenseManager:
             }
 
             # Create hash of system info
-            hardware_id = hashlib.sha256(
+            _HARDWARE_ID = hashlib.sha256(
                 json.dumps(system_info, sort_keys=True).encode()
             ).hexdigest()
 
-            return hardware_id
+            return _HARDWARE_ID
         except Exception as e:
             logger.error(f"Error generating hardware ID: {e}")
             raise
@@ -65,7 +109,9 @@ class LicenseManager:
         """Encrypt license data"""
         try:
             json_data = json.dumps(data)
-            return self.fernet.encrypt(json_data.encode()).decode()
+            nonce = os.urandom(NONCE_SIZE)
+            token = self._aead.encrypt(nonce, json_data.encode(), None)
+            return base64.urlsafe_b64encode(nonce + token).decode()
         except Exception as e:
             logger.error(f"Error encrypting license: {e}")
             raise
@@ -73,19 +119,37 @@ class LicenseManager:
     def _decrypt_license(self, encrypted_data: str) -> Dict[str, Any]:
         """Decrypt license data"""
         try:
-            decrypted_data = self.fernet.decrypt(encrypted_data.encode())
+            if self._is_legacy_license(encrypted_data):
+                decrypted_data = self.fernet.decrypt(encrypted_data.encode())
+            else:
+                raw = base64.urlsafe_b64decode(encrypted_data)
+                decrypted_data = self._aead.decrypt(
+                    raw[:NONCE_SIZE], raw[NONCE_SIZE:], None
+                )
             return json.loads(decrypted_data)
         except Exception as e:
             logger.error(f"Error decrypting license: {e}")
             raise
 
+    @staticmethod
+    def _is_legacy_license(encrypted_data: str) -> bool:
+        """Return True if the data is a Fernet token from an older version"""
+        return encrypted_data.startswith(FERNET_TOKEN_PREFIX)
+
     def load_license(self) -> bool:
         """Load license from file"""
         try:
+            # Read what the last save wrote, not the file it is replacing
+            if _LAST_LICENSE_WRITE:
+                _LAST_LICENSE_WRITE.exception()
             if os.path.exists(self.license_file):
                 with open(self.license_file, "r") as f:
                     encrypted_data = f.read()
                 self.license_data = self._decrypt_license(encrypted_data)
+                self._validate_request = None
+                if self._is_legacy_license(encrypted_data):
+                    # Re-encrypt once so later loads take the faster path
+                    self.save_license(self.license_data)
                 return True
             return False
         except Exception as e:
@@ -94,18 +158,39 @@ class LicenseManager:
 
     def save_license(self, license_data: Dict[str, Any]) -> bool:
         """Save license to file"""
+        global _LAST_LICENSE_WRITE
         try:
             encrypted_data = self._encrypt_license(license_data)
-            with open(self.license_file, "w") as f:
-                f.write(encrypted_data)
+            future = _LICENSE_WRITER.submit(self._write_license_file, encrypted_data)
+            future.add_done_callback(_log_write_failure)
+            _LAST_LICENSE_WRITE = future
             self.license_data = license_data
+            self._cached_validation = None
+            self._validate_request = None
             return True
         except Exception as e:
             logger.error(f"Error saving license: {e}")
             return False
 
+    def _write_license_file(self, encrypted_data: str):
+        """Atomically replace the license file; runs on the writer thread"""
+        tmp_path = self.license_file + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(encrypted_data)
+        os.replace(tmp_path, self.license_file)
+
     def validate_license(self) -> bool:
-        """Validate current license"""
+        """Validate current license, reusing a recent result"""
+        cached = self._cached_validation
+        if cached and time.monotonic() - cached[0] < VALIDATION_CACHE_TTL:
+            return cached[1]
+
+        result = self._validate_license()
+        self._cached_validation = (time.monotonic(), result)
+        return result
+
+    def _validate_license(self) -> bool:
+        """Validate current license locally and with the license server"""
         try:
             if not self.license_data:
                 return False
@@ -116,20 +201,30 @@ class LicenseManager:
                 return False
 
             # Check hardware ID
-            if self.license_data["hardware_id"] != self._get_hardware_id():
+            hardware_id = self._get_hardware_id()
+            if self.license_data["hardware_id"] != hardware_id:
                 logger.warning("Hardware ID mismatch")
                 return False
 
-            # Validate with server
-            response = requests.post(
-                "https://api.tikgen.com/v1/validate-license",
-                json={
-                    "license_key": self.license_data["license_key"],
-                    "hardware_id": self._get_hardware_id(),
-                },
-                headers={
-                    "Authorization": f"Bearer {self.license_data['access_token']}"
-                },
+            # Validate with server; the request only changes with the license
+            if self._validate_request is None:
+                body = json.dumps(
+                    {
+                        "license_key": self.license_data["license_key"],
+                        "hardware_id": hardware_id,
+                    }
+                ).encode()
+                headers = {
+                    "Authorization": f"Bearer {self.license_data['access_token']}",
+                    "Content-Type": "application/json",
+                }
+                self._validate_request = (body, headers)
+            body, headers = self._validate_request
+            response = self._http.post(
+                f"{LICENSE_API_URL}/validate-license",
+                data=body,
+                headers=headers,
+                timeout=REQUEST_TIMEOUT,
             )
 
             if response.status_code != 200:
@@ -148,9 +243,10 @@ class LicenseManager:
             hardware_id = self._get_hardware_id()
 
             # Validate with server
-            response = requests.post(
-                "https://api.tikgen.com/v1/activate-license",
+            response = self._http.post(
+                f"{LICENSE_API_URL}/activate-license",
                 json={"license_key": license_key, "hardware_id": hardware_id},
+                timeout=REQUEST_TIMEOUT,
             )
 
             if response.status_code != 200:
@@ -188,3 +284,7 @@ class LicenseManager:
         except Exception as e:
             logger.error(f"Error checking feature access: {e}")
             return False
+
+    def close(self):
+        """Close the license server connection pool"""
+        self._http.close()